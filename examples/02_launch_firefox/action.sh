@@ -1,5 +1,17 @@
 #!/usr/bin/env bash
 
+# Check for a running Firefox with shell builtins only (no pgrep fork)
+firefox_running() {
+    local comm name
+    for comm in /proc/[0-9]*/comm; do
+        read -r name 2>/dev/null < "$comm" || continue
+        case "$name" in
+            *firefox*) return 0 ;;
+        esac
+    done
+    return 1
+}
+
 # Try to focus using dbus
 if command -v dbus-send >/dev/null 2>&1; then
     dbus-send --session --type=method_call \
@@ -13,7 +25,7 @@ if command -v dbus-send >/dev/null 2>&1; then
 fi
 
 # Try to focus using gdbus if Firefox is already running
-if command -v gdbus >/dev/null 2>&1 && pgrep firefox >/dev/null 2>&1; then
+if command -v gdbus >/dev/null 2>&1 && firefox_running; then
     gdbus call --session \
         --dest=org.gnome.Shell \
         --object-path=/org/gnome/Shell \
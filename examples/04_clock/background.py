@@ -2,13 +2,40 @@
 
 # Update scripts that redraw the clock image every minute
 
+import os
 import time
 from update import draw_clock
 
-def main():
+def _next_minute():
+    return (time.time() // 60 + 1) * 60
+
+def _run_with_timerfd():
+    # Wall-clock timer on minute boundaries - also fires right after resume from suspend
+    tfd = os.timerfd_create(time.CLOCK_REALTIME)
+    try:
+        os.timerfd_settime(tfd, flags=os.TFD_TIMER_ABSTIME, initial=_next_minute(), interval=60)
+        while True:
+            draw_clock()
+            os.read(tfd, 8)
+    finally:
+        os.close(tfd)
+
+def _run_with_sleep():
     while True:
         draw_clock()
-        time.sleep(60)
+        # Absolute deadline on the next minute boundary - never redraw before it
+        deadline = _next_minute()
+        remaining = deadline - time.time()
+        while remaining > 0:
+            time.sleep(remaining)
+            remaining = deadline - time.time()
+
+def main():
+    # os.timerfd_* is available on Linux with Python 3.13+
+    if hasattr(os, 'timerfd_create'):
+        _run_with_timerfd()
+    else:
+        _run_with_sleep()
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -1,27 +1,68 @@
 import os
+import functools
 from datetime import datetime
 from PIL import Image, ImageDraw, ImageFont
 
-# Update script that redraws the clock image 
+# Update script that redraws the clock image
 
-def draw_clock():
-    now = datetime.now()
-    hours = now.strftime("%H")
-    minutes = now.strftime("%M")
-    
-    image = Image.new('RGB', (72, 72), color='black')
-    draw = ImageDraw.Draw(image)
-    
+FONT_PATH = '/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf'
+SIZE = (72, 72)
+BACKGROUND_COLOR = 'black'
+
+# Background is constant, so one canvas is reused and cleared for every frame
+_CANVAS = Image.new('RGB', SIZE, color=BACKGROUND_COLOR)
+_DRAW = ImageDraw.Draw(_CANVAS)
+
+@functools.lru_cache(maxsize=4)
+def _get_font(path, size):
+    # Parse the font file once - background.py calls draw_clock() every minute
     try:
-        font = ImageFont.truetype('/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf', 24)
+        return ImageFont.truetype(path, size)
     except:
-        font = ImageFont.load_default()
-    
-    draw.text((36, 20), hours, font=font, fill='white', anchor='mm')
-    draw.text((36, 50), minutes, font=font, fill='white', anchor='mm')
-    
+        return ImageFont.load_default()
+
+@functools.lru_cache(maxsize=4)
+def _get_digit_sprites(path, size):
+    # Rasterize 0-9 once as masks; every frame then only pastes them
+    font = _get_font(path, size)
+    # Shared vertical extent so all sprites line up on the same middle line
+    top, bottom = ImageDraw.Draw(_CANVAS).textbbox((0, 0), "0123456789", font=font, anchor='lm')[1::2]
+
+    sprites = []
+    for digit in "0123456789":
+        width = int(font.getlength(digit) + 0.5)
+        sprite = Image.new('L', (width, bottom - top))
+        ImageDraw.Draw(sprite).text((0, -top), digit, font=font, fill=255, anchor='lm')
+        sprites.append(sprite)
+    return sprites, top
+
+def _paste_digits(image, center, text, sprites, top):
+    # Same placement as draw.text(center, text, anchor='mm')
+    total_width = sum(sprites[int(ch)].width for ch in text)
+    x = center[0] - total_width // 2
+    y = center[1] + top
+    for ch in text:
+        sprite = sprites[int(ch)]
+        image.paste('white', (x, y, x + sprite.width, y + sprite.height), mask=sprite)
+        x += sprite.width
+
+def draw_clock():
+    now = datetime.now()
+    hours = f"{now.hour:02d}"
+    minutes = f"{now.minute:02d}"
+
+    image = _CANVAS
+    draw = _DRAW
+    draw.rectangle((0, 0) + SIZE, fill=BACKGROUND_COLOR)
+
+    sprites, top = _get_digit_sprites(FONT_PATH, 24)
+
+    _paste_digits(image, (36, 20), hours, sprites, top)
+    _paste_digits(image, (36, 50), minutes, sprites, top)
+
     image_path = os.path.join(os.path.dirname(__file__), 'image.png')
-    image.save(image_path)
+    # Fast deflate: for a 72x72 image higher levels cost time and save little
+    image.save(image_path, compress_level=1, optimize=False)
 
 def main():
     draw_clock()
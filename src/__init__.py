@@ -5,6 +5,12 @@ __author__ = "Denis Gryzlov"
 __email__ = "gryzlov@gmail.com"
 __description__ = "Linux daemon for Stream Deck control without GUI through filesystem"
 
-from .core.daemon import StreamDeckDaemon
+__all__ = ["StreamDeckDaemon"]
 
-__all__ = ["StreamDeckDaemon"]
\ No newline at end of file
+
+def __getattr__(name):
+    # Lazy import - CLI commands shouldn't pay for loading device, image and watchdog libraries
+    if name == "StreamDeckDaemon":
+        from .core.daemon import StreamDeckDaemon
+        return StreamDeckDaemon
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -5,42 +5,57 @@ import sys
 import os
 import subprocess
 from pathlib import Path
-try:
-    from importlib.metadata import version
-except ImportError:
-    # Python < 3.8 fallback
-    from importlib_metadata import version
 
 from .utils import logger
-from .setup import run_setup, run_uninstall, needs_setup
 from .utils.config import CONFIG_DIR
 
 
-def _check_service_prerequisites(service_manager: 'ServiceManager') -> bool:
-    """Check if service can be started/restarted - common validation logic."""
-    if not service_manager.is_service_installed():
-        print("Service is not installed. Run 'deckfs setup' first.")
-        return False
+class _VersionAction(argparse.Action):
+    """Print package version - metadata lookup only happens when -v is requested."""
     
-    # Only check if config directory exists - daemon handles missing files with auto-reload
-    config_path = Path(CONFIG_DIR)
-    if not config_path.exists():
-        print("🔧 Configuration directory not found.")
-        print("📋 Please run 'deckfs setup' to configure the service first.")
-        return False
+    def __init__(self, option_strings, dest=argparse.SUPPRESS, default=argparse.SUPPRESS,
+                 help="show program's version number and exit"):
+        super().__init__(option_strings=option_strings, dest=dest, default=default,
+                         nargs=0, help=help)
     
-    return True
+    def __call__(self, parser, namespace, values, option_string=None):
+        try:
+            from importlib.metadata import version
+        except ImportError:
+            # Python < 3.8 fallback
+            from importlib_metadata import version
+        
+        try:
+            pkg_version = version("deckfs")
+        except Exception:
+            # Fallback if package not installed or metadata unavailable
+            pkg_version = "development"
+        
+        parser.exit(message=f"deckfs {pkg_version}\n")
 
 
 class ServiceManager:
     """Manages systemd service operations."""
     
+    # action -> (progress verb, systemctl command, past tense)
+    ACTIONS = {
+        'start': ("Starting", 'start', "started"),
+        'stop': ("Stopping", 'stop', "stopped"),
+        'restart': ("Restarting", 'restart', "restarted"),
+        'reload': ("Reloading", 'reload-or-restart', "reloaded"),
+        'enable': ("Enabling", 'enable', "enabled"),
+        'disable': ("Disabling", 'disable', "disabled"),
+    }
+    
     def __init__(self):
         self.service_name = "deckfs"
     
     def _run_systemctl(self, command: str) -> bool:
         """Run systemctl command.
         
+        Stdout is discarded - systemctl prints nothing useful there for
+        start/stop/enable-like commands, only the exit code matters.
+        
         Args:
             command: systemctl command to run
             
@@ -50,16 +65,20 @@ class ServiceManager:
         try:
             result = subprocess.run(
                 ['systemctl', '--user', command, self.service_name],
-                capture_output=True, text=True
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE
             )
             
             if result.returncode == 0:
-                if result.stdout.strip():
-                    print(result.stdout.strip())
                 return True
+            
+            # Output is only decoded when there is an error to report
+            stderr = result.stderr.decode('utf-8', 'replace')
+            if self._is_unit_missing(stderr):
+                print("Service is not installed. Run 'deckfs setup' first.")
             else:
-                print(f"Error: {result.stderr.strip()}")
-                return False
+                print(f"Error: {stderr.strip()}")
+            return False
                 
         except FileNotFoundError:
             print("Error: systemctl not found. Is systemd installed?")
@@ -68,51 +87,38 @@ class ServiceManager:
             print(f"Error running systemctl: {e}")
             return False
     
-    def start(self) -> bool:
-        """Start the service."""
-        print(f"Starting {self.service_name} service...")
-        if self._run_systemctl('start'):
-            print("Service started successfully")
-            return True
-        return False
-    
-    def stop(self) -> bool:
-        """Stop the service."""
-        print(f"Stopping {self.service_name} service...")
-        if self._run_systemctl('stop'):
-            print("Service stopped successfully")
-            return True
-        return False
-    
-    def restart(self) -> bool:
-        """Restart the service."""
-        print(f"Restarting {self.service_name} service...")
-        if self._run_systemctl('restart'):
-            print("Service restarted successfully")
-            return True
-        return False
+    def _is_unit_missing(self, stderr: str) -> bool:
+        """Check systemctl error output for a missing unit file.
+        
+        Lets start/restart report an uninstalled service without a separate
+        list-unit-files call before every action.
+        """
+        unit = f"{self.service_name}.service"
+        # start/stop/restart: "Unit X not found", enable/disable: "Unit file X does not exist"
+        return f"{unit} not found" in stderr or f"{unit} does not exist" in stderr
     
-    def reload(self) -> bool:
-        """Reload the service configuration."""
-        print(f"Reloading {self.service_name} service...")
-        if self._run_systemctl('reload-or-restart'):
-            print("Service reloaded successfully")
+    def run_action(self, action: str) -> bool:
+        """Run a service action from ACTIONS, e.g. 'start' or 'enable'.
+        
+        Args:
+            action: Action name
+            
+        Returns:
+            bool: True if action succeeded
+        """
+        verb, command, done = self.ACTIONS[action]
+        print(f"{verb} {self.service_name} service...")
+        if self._run_systemctl(command):
+            print(f"Service {done} successfully")
             return True
         return False
     
     def status(self) -> bool:
         """Show service status."""
         try:
-            result = subprocess.run(
-                ['systemctl', '--user', 'status', self.service_name],
-                capture_output=True, text=True
-            )
-            
-            # Always show output for status command, regardless of exit code
-            if result.stdout.strip():
-                print(result.stdout.strip())
-            if result.stderr.strip():
-                print(result.stderr.strip())
+            # Let systemctl write straight to the terminal instead of capturing
+            # and re-printing its output; --no-pager keeps it non-interactive
+            subprocess.run(['systemctl', '--user', '--no-pager', 'status', self.service_name])
                 
             # Status command can return non-zero for inactive services, that's normal
             return True
@@ -123,48 +129,32 @@ class ServiceManager:
         except Exception as e:
             print(f"Error running systemctl: {e}")
             return False
-    
-    def enable(self) -> bool:
-        """Enable service to start automatically."""
-        print(f"Enabling {self.service_name} service...")
-        if self._run_systemctl('enable'):
-            print("Service enabled successfully")
-            return True
-        return False
-    
-    def disable(self) -> bool:
-        """Disable service from starting automatically."""
-        print(f"Disabling {self.service_name} service...")
-        if self._run_systemctl('disable'):
-            print("Service disabled successfully")
-            return True
-        return False
-    
-    def is_service_installed(self) -> bool:
-        """Check if service is installed."""
-        try:
-            result = subprocess.run(
-                ['systemctl', '--user', 'list-unit-files', self.service_name + '.service'],
-                capture_output=True, text=True
-            )
-            return self.service_name in result.stdout
-        except:
-            return False
 
 
 def create_config_structure():
     """Create basic configuration structure (legacy --init)."""
     config_dir = os.path.expanduser("~/.local/streamdeck")
     
-    if not os.path.exists(config_dir):
+    try:
         os.makedirs(config_dir)
         logger.info(f"Created configuration directory: {config_dir}")
+    except FileExistsError:
+        pass
+    
+    # List config directory once instead of checking every button folder separately
+    with os.scandir(config_dir) as entries:
+        existing = {entry.name for entry in entries}
     
     # Create example folders for first three buttons
     for i in range(1, 4):
-        button_dir = os.path.join(config_dir, f"{i:02d}")
-        if not os.path.exists(button_dir):
-            os.makedirs(button_dir)
+        name = f"{i:02d}"
+        if name not in existing:
+            button_dir = os.path.join(config_dir, name)
+            try:
+                os.mkdir(button_dir)
+            except FileExistsError:
+                # Created concurrently since the listing
+                continue
             logger.info(f"Created folder for button {i}: {button_dir}")
 
 
@@ -217,16 +207,9 @@ def main():
     subparsers.add_parser('init', help='Create basic configuration structure (legacy)')
     
     # Global options
-    try:
-        pkg_version = version("deckfs")
-    except Exception:
-        # Fallback if package not installed or metadata unavailable
-        pkg_version = "development"
-    
     parser.add_argument(
         "-v", "--version", 
-        action="version",
-        version=f"deckfs {pkg_version}"
+        action=_VersionAction
     )
     
     args = parser.parse_args()
@@ -238,6 +221,7 @@ def main():
         
         # Only auto-run setup if config directory doesn't exist at all (true first time)
         if not config_path.exists():            
+            from .setup import run_setup
             try:
                 if run_setup(config_dir):
                     print("\nSetup completed successfully!")
@@ -257,6 +241,7 @@ def main():
     
     # Handle commands
     if args.command == 'setup':
+        from .setup import run_setup
         config_dir = args.config_dir or CONFIG_DIR
         if run_setup(config_dir):
             print("\nSetup completed successfully!")
@@ -266,6 +251,7 @@ def main():
             sys.exit(1)
     
     elif args.command == 'uninstall':
+        from .setup import run_uninstall
         config_dir = args.config_dir or CONFIG_DIR
         if not run_uninstall(config_dir):
             print("\nUninstall was not completed.")
@@ -278,30 +264,20 @@ def main():
         print("2. Create action scripts (e.g.: ~/.local/streamdeck/01/action.sh)")
         print("3. Start service: deckfs start")
     
-    elif args.command == 'start':
-        if not _check_service_prerequisites(service_manager):
-            sys.exit(1)
-        success = service_manager.start()
-    
-    elif args.command == 'stop':
-        success = service_manager.stop()
-    
-    elif args.command == 'restart':
-        if not _check_service_prerequisites(service_manager):
+    elif args.command in ('start', 'restart'):
+        # Missing unit is reported by systemctl itself, only the config directory
+        # is checked here - daemon handles missing files inside it with auto-reload
+        if not Path(CONFIG_DIR).exists():
+            print("🔧 Configuration directory not found.")
+            print("📋 Please run 'deckfs setup' to configure the service first.")
             sys.exit(1)
-        success = service_manager.restart()
-    
-    elif args.command == 'reload':
-        success = service_manager.reload()
+        success = service_manager.run_action(args.command)
     
     elif args.command == 'status':
         success = service_manager.status()
     
-    elif args.command == 'enable':
-        success = service_manager.enable()
-    
-    elif args.command == 'disable':
-        success = service_manager.disable()
+    elif args.command in ServiceManager.ACTIONS:
+        success = service_manager.run_action(args.command)
     
     else:
         success = True
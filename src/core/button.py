@@ -1,9 +1,11 @@
+import hashlib
 import os
 import time
-import threading
-from typing import Optional
+from collections import deque
+from typing import Deque, Optional, Tuple
 from PIL import Image
 from .processes import ProcessManager
+from .scheduler import ScheduledCall, get_scheduler
 from ..utils.file_utils import find_any_file
 from ..utils import logger
 
@@ -24,10 +26,25 @@ class Button:
         # Error state tracking
         self.failed = False
         
+        # Resolved image.* path, rescanned only after image file changes
+        self._image_path: Optional[str] = None
+        self._image_path_valid = False
+        # (image path, (link inode, link mtime_ns, target device, target inode), realpath)
+        # - avoids realpath() per redraw
+        self._resolved_image: Optional[Tuple[str, Tuple[int, int, int, int], str]] = None
+        # ((image path, inode, mtime_ns, size), content digest) of the last drawn image
+        self._image_content: Optional[Tuple[Tuple[str, int, int, int], bytes]] = None
+        
         # Background script crash protection
-        self.background_crash_timestamps = []
         self.restart_limits = 5
         self.restart_window = 300  # 5 minutes
+        self.restart_delays = (2.0, 4.0, 8.0, 16.0, 32.0)  # Backoff by crash count
+        # Only the last restart_limits + 1 crashes can matter for the limit check
+        self.background_crash_timestamps: Deque[float] = deque(maxlen=self.restart_limits + 1)
+        
+        # Delayed background restart and action error reset, cancelled on stop()
+        self._restart_call: Optional[ScheduledCall] = None
+        self._error_clear_call: Optional[ScheduledCall] = None
         
         # Process manager for this button with unified callback
         self.process_manager = ProcessManager(
@@ -53,17 +70,17 @@ class Button:
         # Update script is optional - not finding it is not an error
         self.process_manager.start_script_sync("update")
         
+        # Update script may have created or switched the image
+        self._invalidate_image_path()
+        
         return True
         
     def reload(self):
-        """Called when button files change to recreate ProcessManager and restart scripts."""
+        """Called when button files change to restart scripts."""
+        # stop() leaves the ProcessManager with no processes and monitoring off,
+        # so it is reused as is instead of being recreated
         self.stop()
         
-        self.process_manager = ProcessManager(
-            self.working_dir,
-            on_script_completed=self._on_script_completed
-        )
-            
         self.load_config()
         self.start()
         
@@ -74,13 +91,14 @@ class Button:
             
         self.running = True
         
+        # Start process monitoring first - the monitor only tracks exits of
+        # processes whose manager is registered
+        self.process_manager.start_monitoring()
+        
         # Start background script if exists (only if not already running)
         if not self.process_manager.is_running("background"):
             self.process_manager.start_script_async("background")
         
-        # Start process monitoring
-        self.process_manager.start_monitoring()
-        
     def stop(self):
         """Called during shutdown or disconnection to cleanup all processes and threads."""
         if not self.running:
@@ -88,6 +106,11 @@ class Button:
             
         self.running = False
         
+        # Don't restart scripts or redraw after shutdown
+        for call in (self._restart_call, self._error_clear_call):
+            if call:
+                call.cancel()
+        
         self.process_manager.cleanup()
         
     def handle_press(self):
@@ -97,18 +120,38 @@ class Button:
         self.process_manager.start_script_async("action")
         
     def set_failed(self, failed: bool):
+        # Redraw only on a real state change - load_config and background
+        # restarts clear the flag routinely
+        if self.failed == failed:
+            return
         self.failed = failed
         self.request_redraw()   
 
+    def _clear_action_error(self):
+        """Restore normal display after a failed action, unless stopped meanwhile."""
+        if self.running:
+            self.set_failed(False)
+            
     def _find_image_file(self) -> Optional[str]:
-        """Internal method to locate image.* file for display on device."""
-        return find_any_file(self.working_dir, "image")
+        """Internal method to locate image.* file for display on device.
+        
+        Directory is scanned once and the result cached until an image
+        file change is reported through file_changed().
+        """
+        if not self._image_path_valid:
+            self._image_path = find_any_file(self.working_dir, "image")
+            self._image_path_valid = True
+        return self._image_path
     
-    def get_image(self) -> Optional[Image.Image]:
-        """Get PIL Image for this button or None if error/no image.
+    def _invalidate_image_path(self):
+        self._image_path_valid = False
+        self._resolved_image = None
+    
+    def get_image_path(self) -> Optional[str]:
+        """Get resolved path of this button's image or None if error/no image.
         
         Returns:
-            Optional[Image.Image]: PIL Image or None if error/no image
+            Optional[str]: Existing image file path or None if error/no image
         """
         if self.failed:
             return None
@@ -118,19 +161,78 @@ class Button:
             return None
             
         try:
-            # Resolve symlinks for dynamic image switching
-            resolved_path = os.path.realpath(image_path)
-            if not os.path.exists(resolved_path):
-                logger.error(f"Image symlink target not found: {resolved_path}")
-                return None
-                
-            image = Image.open(resolved_path)
-            logger.debug(f"Image loaded: {resolved_path}")
+            st = os.lstat(image_path)
+        except OSError:
+            # Cached path is stale (e.g. image removed) - rescan next time
+            self._invalidate_image_path()
+            return None
+            
+        try:
+            target_st = os.stat(image_path)
+        except OSError:
+            logger.error(f"Image symlink target not found: {os.path.realpath(image_path)}")
+            # Cached path may be stale (e.g. image removed) - rescan next time
+            self._invalidate_image_path()
+            return None
+            
+        # Keyed on the image.* entry and on the file it finally points to, so
+        # re-pointing any link of a chain (image.png -> current.png -> a.png)
+        # is noticed without an image.* event
+        link_id = (st.st_ino, st.st_mtime_ns, target_st.st_dev, target_st.st_ino)
+        cached = self._resolved_image
+        if cached and cached[0] == image_path and cached[1] == link_id:
+            return cached[2]
+            
+        # Resolve symlinks for dynamic image switching
+        resolved_path = os.path.realpath(image_path)
+            
+        self._resolved_image = (image_path, link_id, resolved_path)
+        return resolved_path
+    
+    def get_image(self) -> Optional[Image.Image]:
+        """Get PIL Image for this button or None if error/no image.
+        
+        Returns:
+            Optional[Image.Image]: PIL Image or None if error/no image
+        """
+        image_path = self.get_image_path()
+        if not image_path:
+            return None
+            
+        try:
+            image = Image.open(image_path)
+            logger.debug(f"Image loaded: {image_path}")
             return image
         except Exception as e:
             logger.error(f"Error loading image {image_path}: {e}")
             return None
     
+    def _image_content_changed(self) -> bool:
+        """Check whether image.* content differs from the last seen one.
+        
+        Atomic saves and editor autosave often rewrite the image with the
+        same bytes - those don't need to be decoded and sent again.
+        """
+        image_path = self._find_image_file()
+        if not image_path:
+            self._image_content = None
+            return True
+            
+        try:
+            st = os.stat(image_path)
+            stat_id = (image_path, st.st_ino, st.st_mtime_ns, st.st_size)
+            if self._image_content and self._image_content[0] == stat_id:
+                return False
+            with open(image_path, 'rb') as f:
+                digest = hashlib.blake2b(f.read(), digest_size=16).digest()
+        except OSError:
+            self._image_content = None
+            return True
+            
+        changed = not self._image_content or self._image_content[1] != digest
+        self._image_content = (stat_id, digest)
+        return changed
+    
     def file_changed(self, filename: str) -> bool:
         """Called by coordinator when any file in button directory changes.
         
@@ -141,9 +243,11 @@ class Button:
             
         Returns:
             bool: True if this file change was handled, False if ignored
+                  or the image content didn't change
         """
         if filename.startswith("image."):
-            return True
+            self._invalidate_image_path()
+            return self._image_content_changed()
         
         elif filename.startswith("background."):
             logger.debug(f"Background script changed in {self.working_dir}")
@@ -170,17 +274,19 @@ class Button:
             script_name: Name of script that completed (action, background, update)
             exit_code: Exit code of the script
         """
+        # Exit reported while stop() was tearing down - nothing to restart or show
+        if not self.running:
+            return
+            
         if script_name == "background":
             # Background script crashed, try to restart it with crash protection
             logger.debug(f"Background script exited with code {exit_code}, checking restart limits...")
             
-            current_time = time.time()
+            current_time = time.monotonic()
             
-            # Sliding window crash protection
-            self.background_crash_timestamps = [
-                ts for ts in self.background_crash_timestamps
-                if current_time - ts < self.restart_window
-            ]
+            # Sliding window crash protection - timestamps are in order, drop expired from the left
+            while self.background_crash_timestamps and current_time - self.background_crash_timestamps[0] >= self.restart_window:
+                self.background_crash_timestamps.popleft()
             
             self.background_crash_timestamps.append(current_time)
             
@@ -191,13 +297,19 @@ class Button:
                 # Clear any previous error state immediately - we're going to try restart
                 self.set_failed(False)
                     
-                # Wait a bit before restart to avoid rapid restart loops
+                # Wait before restart to avoid rapid restart loops, longer
+                # with every crash within the window
+                crash_count = len(self.background_crash_timestamps)
+                delay = self.restart_delays[min(crash_count, len(self.restart_delays)) - 1]
+                
                 def restart_after_delay():
+                    if not self.running:
+                        return
                     success = self.process_manager.start_script_async("background")
                     if not success:
                         self.set_failed(True)
                 
-                threading.Timer(2.0, restart_after_delay).start()
+                self._restart_call = get_scheduler().schedule(delay, restart_after_delay)
 
         elif script_name == "action":
             # Action script completed
@@ -205,10 +317,10 @@ class Button:
                 # Action failed, show error temporarily
                 self.set_failed(True)
                 
-                # Clear error after 2 seconds to restore normal display
-                def clear_action_error():
-                    self.set_failed(False)
-                    
-                threading.Timer(2.0, clear_action_error).start()
+                # Clear error after 2 seconds to restore normal display,
+                # counting from the latest failure
+                if self._error_clear_call:
+                    self._error_clear_call.cancel()
+                self._error_clear_call = get_scheduler().schedule(2.0, self._clear_action_error)
         # Update scripts are handled synchronously, no callback needed
     
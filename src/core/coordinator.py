@@ -1,5 +1,10 @@
 import os
-from typing import Optional, Dict, Any
+import queue
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Optional, Dict, Any, List, Iterable
 
 from ..utils.debouncer import Debouncer
 from .files import FileWatcher
@@ -7,9 +12,19 @@ from .button import Button
 from .hardware import DeviceHardwareManager
 from ..utils.config import ConfigManager, get_config
 from ..utils.file_utils import *
-from ..utils.image_utils import prepare_image_for_deck, load_blank_image, load_error_image
+from ..utils.image_utils import prepare_image_for_deck, prepare_image_file_for_deck, load_blank_image, load_error_image
 from ..utils import logger
 
+# Seconds to collect redraw requests before writing to the device
+RENDER_COALESCE_WINDOW = 0.016
+
+# Update scripts run in parallel at startup/reload, at most this many at once
+UPDATE_WORKERS = 4
+
+# Buttons stopped in parallel at once, and how long to wait for all of them
+STOP_WORKERS = 16
+STOP_TIMEOUT = 15.0
+
 
 class Coordinator:
     """High-level Stream Deck coordinator.
@@ -37,6 +52,17 @@ class Coordinator:
         # Button management
         self.buttons: Dict[int, Button] = {}
         
+        # Key count of the connected device, 0 while disconnected
+        self._key_count = 0
+        
+        # Blank/error images in device format - geometry is fixed per connection
+        self._blank_bytes: Optional[bytes] = None
+        self._error_bytes: Optional[bytes] = None
+        
+        # Redraw requests from button threads are rendered by one thread
+        self.redraw_queue: queue.SimpleQueue = queue.SimpleQueue()
+        self.render_thread: Optional[threading.Thread] = None
+        
         # Hardware abstraction
         self.hardware = DeviceHardwareManager(
             on_connect=self._on_device_connected,
@@ -55,6 +81,9 @@ class Coordinator:
         Returns:
             bool: True if initialization successful
         """
+        self.render_thread = threading.Thread(target=self._render_loop, daemon=True, name="Render")
+        self.render_thread.start()
+        
         self.hardware.start_monitoring()
         self.file_watcher.start_watching()
         
@@ -63,7 +92,7 @@ class Coordinator:
         
     def _get_key_count(self) -> int:
         """Returns device key count or 0 if no device connected."""
-        return self.hardware.get_key_count()
+        return self._key_count
         
     def start(self):
         """Called after device connection to start all configured buttons."""
@@ -82,12 +111,16 @@ class Coordinator:
         self.hardware.stop_monitoring()
         
         # Stop all buttons
-        for button in self.buttons.values():
-            button.stop()
+        self._teardown_buttons()
             
         # Stop file watching and debouncer
         self.file_watcher.stop_watching()
         self.debouncer.shutdown()
+        
+        # Wake render thread so it can exit
+        self.redraw_queue.put(None)
+        if self.render_thread:
+            self.render_thread.join(timeout=2)
             
         logger.info("Stream Deck coordinator stopped")
         
@@ -103,37 +136,49 @@ class Coordinator:
         
         working_dir = find_button_working_dir(self.config_dir, button_id)
         if working_dir:
-            button = Button(working_dir, lambda bid=button_id: self.update_button_image(bid))
+            button = Button(working_dir, partial(self.request_redraw, button_id))
             self.buttons[button_id] = button
             if button.load_config():
                 button.start()
-                self.update_button_image(button_id)
-            else:
-                # load_config failed, show error image
-                self._show_error_image(button_id)
+            # If load_config failed, error state is already set and the error image is rendered
+            self.request_redraw(button_id)
             logger.debug(f"Button {button_id:02d} reloaded")
         else:
             self.clear_buttons(button_id)
             logger.debug(f"Button {button_id:02d} removed")
             
-    def reload_all(self):
-        """Called when button directories are renamed/moved to recreate all buttons."""
-        logger.info("Reloading all buttons...")
+    def request_redraw(self, button_id: int):
+        """Queue button image update, safe to call from any thread.
         
-        for button in self.buttons.values():
-            button.stop()
-            
-        # Recreate buttons (handles renamed/removed directories)
-        old_buttons = self.buttons
-        self._create_buttons()
+        Args:
+            button_id: Button ID (1-based)
+        """
+        self.redraw_queue.put(button_id)
         
-        for button_id, old_button in old_buttons.items():
-            old_button.stop()
-                
-        self._load_all_buttons()
-        self.start()
+    def _render_loop(self):
+        """Render thread - updates images of buttons that requested a redraw.
         
-        logger.info("All buttons reloaded")
+        Requests arriving within RENDER_COALESCE_WINDOW are merged, so each
+        button is written to the device at most once per batch.
+        """
+        while not self.shutdown_requested:
+            pending = {self.redraw_queue.get()}
+            deadline = time.monotonic() + RENDER_COALESCE_WINDOW
+            while True:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    pending.add(self.redraw_queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
+            
+            # None is the shutdown wakeup from stop()
+            pending.discard(None)
+            try:
+                self.update_button_images(sorted(pending))
+            except Exception as e:
+                logger.error(f"Error rendering buttons {sorted(pending)}: {e}")
     
     def update_button_image(self, button_id: int):
         """Update button image on device.
@@ -141,37 +186,56 @@ class Coordinator:
         Args:
             button_id: Button ID (1-based)
         """
-        if not self.hardware.is_connected():
-            return
-            
-        if button_id not in self.buttons:
+        self.update_button_images([button_id])
+        
+    def update_button_images(self, button_ids: List[int]):
+        """Update images of several buttons in one batch.
+        
+        Connection is checked once and all keys are written under one hold
+        of the device lock.
+        
+        Args:
+            button_ids: Button IDs (1-based)
+        """
+        if not button_ids or not self.hardware.is_connected():
             return
             
-        button = self.buttons[button_id]
+        images = {}
+        for button_id in button_ids:
+            image_bytes = self._render_button(button_id)
+            if image_bytes:
+                images[button_id - 1] = image_bytes  # Convert to 0-based index
+                
+        self.hardware.set_key_images(images)
         
-        # Get PIL Image from button
-        image = button.get_image()
+    def _render_button(self, button_id: int) -> Optional[bytes]:
+        """Get device-ready image for a button - its own image or the error image.
         
-        if image:
-            # Normal image - prepare and display it
-            try:
-                image_bytes = prepare_image_for_deck(self.hardware.deck, image)
-                if image_bytes:
-                    key_index = button_id - 1  # Convert to 0-based index
-                    self.hardware.set_key_image(key_index, image_bytes)
-                    logger.debug(f"Button {button_id:02d}: Normal image displayed")
-                else:
-                    logger.error(f"Button {button_id:02d}: Failed to prepare image")
-                    button.failed = True
-                    self._show_error_image(button_id)
-            except Exception as e:
-                logger.error(f"Button {button_id:02d}: Error setting image on device: {e}")
-                button.failed = True
-                self._show_error_image(button_id)
-        else:
-            # Button has error or no image - show error image
-            self._show_error_image(button_id)
+        Args:
+            button_id: Button ID (1-based)
+            
+        Returns:
+            Optional[bytes]: Image data in device-native format or None if
+                             button doesn't exist or nothing could be prepared
+        """
+        # Single lookup - buttons may be swapped out by another thread meanwhile
+        button = self.buttons.get(button_id)
+        if button is None:
+            return None
+            
+        image_path = button.get_image_path()
         
+        if image_path:
+            # Normal image - prepare (or reuse prepared bytes)
+            image_bytes = prepare_image_file_for_deck(self.hardware.deck, image_path)
+            if image_bytes:
+                logger.debug(f"Button {button_id:02d}: Normal image displayed")
+                return image_bytes
+            # Unreadable image - show error until the file changes again
+            
+        # Button has error or no image - show error image
+        logger.debug(f"Button {button_id:02d}: Error image displayed")
+        return self._get_error_image_bytes()
     
     def clear_buttons(self, button_id: Optional[int] = None):
         """Clear Stream Deck button(s).
@@ -182,107 +246,171 @@ class Coordinator:
         if not self.hardware.is_connected():
             return
             
-        blank_image = load_blank_image()
-        if not blank_image:
+        key_count = self._get_key_count()
+        if button_id is None:
+            self._set_button_images(range(1, key_count + 1), self._get_blank_image_bytes())
+            logger.debug(f"All {key_count} buttons cleared")
+        elif 1 <= button_id <= key_count:
+            self._set_button_images([button_id], self._get_blank_image_bytes())
+            logger.debug(f"Button {button_id:02d} cleared")
+    
+    def _set_button_images(self, button_ids: Iterable[int], image_bytes: Optional[bytes]):
+        """Show the same prepared image on several buttons in one batch.
+        
+        Args:
+            button_ids: Button IDs (1-based)
+            image_bytes: Image data in device-native format, nothing is
+                         written if None
+        """
+        if not image_bytes:
             return
+        # Convert to 0-based key indexes
+        self.hardware.set_key_images({button_id - 1: image_bytes for button_id in button_ids})
+                
+    def _get_blank_image_bytes(self) -> Optional[bytes]:
+        """Get blank image prepared for the connected device, cached per connection."""
+        if self._blank_bytes is None:
+            self._blank_bytes = self._prepare_resource_image(load_blank_image())
+        return self._blank_bytes
+        
+    def _get_error_image_bytes(self) -> Optional[bytes]:
+        """Get error image prepared for the connected device, cached per connection."""
+        if self._error_bytes is None:
+            self._error_bytes = self._prepare_resource_image(load_error_image())
+        return self._error_bytes
+        
+    def _prepare_resource_image(self, image) -> Optional[bytes]:
+        """Convert a bundled resource image to the connected device's format.
+        
+        Args:
+            image: PIL Image from load_blank_image()/load_error_image(), or None
             
-        try:
-            image_bytes = prepare_image_for_deck(self.hardware.deck, blank_image)
-            if not image_bytes:
-                return
+        Returns:
+            Optional[bytes]: Image data in device-native format or None if failed
+        """
+        if not image:
+            return None
             
-            if button_id is None:
-                key_count = self._get_key_count()
-                for key_index in range(key_count):
-                    self.hardware.set_key_image(key_index, image_bytes)
-                logger.debug(f"All {key_count} buttons cleared")
-            else:
-                if 1 <= button_id <= self._get_key_count():
-                    key_index = button_id - 1
-                    self.hardware.set_key_image(key_index, image_bytes)
-                    logger.debug(f"Button {button_id:02d} cleared")
-                    
+        try:
+            return prepare_image_for_deck(self.hardware.deck, image)
         except Exception as e:
-            logger.error(f"Error clearing buttons: {e}")
-            pass
-    
-    def _show_error_image(self, button_id: int):
-        """Show error image on button.
+            logger.error(f"Error preparing resource image: {e}")
+            return None
+            
+    def _stop_buttons(self, buttons: Iterable[Button]):
+        """Stop buttons in parallel.
+        
+        Each button may wait up to 5 seconds for its scripts to exit after
+        SIGTERM, so stopping one after another could take minutes on a full deck.
+        
+        Waits at most STOP_TIMEOUT, so one hung button can't block shutdown
+        or reconnect. Workers are daemon threads (unlike ThreadPoolExecutor's),
+        so a hung stop doesn't keep the process alive at exit either.
         
         Args:
-            button_id: Button ID (1-based)
+            buttons: Buttons to stop
         """
-        if not self.hardware.is_connected():
+        pending: queue.SimpleQueue = queue.SimpleQueue()
+        count = 0
+        for button in buttons:
+            if button.running:
+                pending.put(button)
+                count += 1
+        if not count:
             return
             
-        error_image = load_error_image()
-        if not error_image:
-            return
+        def stop_worker():
+            while True:
+                try:
+                    button = pending.get_nowait()
+                except queue.Empty:
+                    return
+                try:
+                    button.stop()
+                except Exception as e:
+                    logger.error(f"Error stopping button in {button.working_dir}: {e}")
+                    
+        threads = [threading.Thread(target=stop_worker, daemon=True, name="Stop")
+                   for _ in range(min(STOP_WORKERS, count))]
+        for thread in threads:
+            thread.start()
             
-        try:
-            image_bytes = prepare_image_for_deck(self.hardware.deck, error_image)
-            if image_bytes:
-                key_index = button_id - 1
-                self.hardware.set_key_image(key_index, image_bytes)
-                logger.debug(f"Button {button_id:02d}: Error image displayed")
-                
-        except Exception as e:
-            logger.error(f"Button {button_id:02d}: Error showing error image: {e}")
-            pass
+        deadline = time.monotonic() + STOP_TIMEOUT
+        for thread in threads:
+            thread.join(max(0.0, deadline - time.monotonic()))
+        if any(thread.is_alive() for thread in threads):
+            logger.warn(f"Buttons still stopping after {STOP_TIMEOUT}s, continuing without them")
+            
+    def _teardown_buttons(self):
+        """Stop all buttons and forget them.
         
+        The dict is swapped out first, so nothing sees half-stopped buttons
+        in self.buttons.
+        """
+        buttons, self.buttons = self.buttons, {}
+        self._stop_buttons(buttons.values())
             
     def _create_buttons(self):
         """Scans config directory for button folders and creates Button instances."""
-        for button in self.buttons.values():
-            button.stop()
-        self.buttons.clear()
+        self._teardown_buttons()
         
         key_count = self._get_key_count()
         if key_count == 0:
             return
         
-        for button_id in range(1, key_count + 1):
-            working_dir = find_button_working_dir(self.config_dir, button_id)
-            if working_dir:
-                button = Button(working_dir, lambda bid=button_id: self.update_button_image(bid))
-                self.buttons[button_id] = button
+        # One listing of the config directory instead of one per key
+        button_dirs = find_button_directories(self.config_dir, key_count)
+        for button_id, dir_name in sorted(button_dirs.items()):
+            working_dir = os.path.join(self.config_dir, dir_name)
+            button = Button(working_dir, partial(self.request_redraw, button_id))
+            self.buttons[button_id] = button
             
     def _load_all_buttons(self):
-        """Executes update scripts and loads images for all buttons after device connection."""
-        for button_id, button in self.buttons.items():
-            if button.load_config():
-                self.update_button_image(button_id)
-            else:
-                # load_config failed, error state is already set in Button.load_config()
-                self._show_error_image(button_id)
+        """Executes update scripts and loads images for all buttons after device connection.
+        
+        Update scripts of different buttons run in parallel, each button is
+        drawn as soon as its own script finishes.
+        """
+        with ThreadPoolExecutor(max_workers=UPDATE_WORKERS, thread_name_prefix="Update") as pool:
+            for button_id, button in self.buttons.items():
+                pool.submit(self._load_button, button_id, button)
+                
+    def _load_button(self, button_id: int, button: Button):
+        """Runs button update script and queues its first redraw."""
+        try:
+            button.load_config()
+        except Exception as e:
+            logger.error(f"Button {button_id:02d}: Error loading: {e}")
+        # If load_config failed, error state is already set and the error image is rendered
+        self.request_redraw(button_id)
             
-    def _smart_reload_affected_buttons(self, event_type: str, src_path: str, dest_path: str):
+    def _smart_reload_affected_buttons(self, changes: List[Dict[str, Any]]):
         """Smart reload only affected buttons.
         
         Args:
-            event_type: Type of directory event
-            src_path: Source path
-            dest_path: Destination path (for moves)
+            changes: Directory events, each with event_type, src_path and
+                dest_path (for moves)
         """
+        key_count = self._get_key_count()
         affected_buttons = set()
         
-        if event_type == "moved":
-            src_button_id = extract_button_id_from_path(src_path, self.config_dir, self._get_key_count())
-            dest_button_id = extract_button_id_from_path(dest_path, self.config_dir, self._get_key_count())
-            
-            if src_button_id:
-                affected_buttons.add(src_button_id)
-            if dest_button_id:
-                affected_buttons.add(dest_button_id)
+        for change in changes:
+            event_type = change.get('event_type')
+            if event_type == "moved":
+                paths = (change.get('src_path'), change.get('dest_path'))
+            elif event_type in ["created", "deleted", "modified"]:
+                paths = (change.get('src_path'),)
+            else:
+                continue
                 
-        elif event_type in ["created", "deleted", "modified"]:
-            button_id = extract_button_id_from_path(src_path, self.config_dir, self._get_key_count())
-            if button_id:
-                affected_buttons.add(button_id)
+            for path in paths:
+                button_id = extract_button_id_from_path(path, self.config_dir, key_count)
+                if button_id:
+                    affected_buttons.add(button_id)
         
         logger.debug(f"Reloading affected buttons: {sorted(affected_buttons)}")
         
-        for button_id in affected_buttons:
+        for button_id in sorted(affected_buttons):
             logger.debug(f"Reloading button {button_id:02d}")
             self.reload_button(button_id)
                 
@@ -295,9 +423,12 @@ class Coordinator:
         """
         if self.buttons:
             logger.warn("Warning: buttons exist during reconnection, cleaning up...")
-            for button in self.buttons.values():
-                button.stop()
-            self.buttons.clear()
+            self._teardown_buttons()
+            
+        # Device may differ from the previous one - prepare resources anew
+        self._blank_bytes = None
+        self._error_bytes = None
+        self._key_count = self.hardware.get_key_count()
             
         # Clear all buttons to ensure clean state on reconnect
         self.clear_buttons()
@@ -314,13 +445,11 @@ class Coordinator:
         """Called by DeviceHardwareManager when device disconnects."""
         logger.debug(f"Stopping {len(self.buttons)} buttons due to device disconnection...")
         
-        # Clear all buttons before cleanup
-        self.clear_buttons()
-        
-        for button_id, button in self.buttons.items():
-            logger.debug(f"Stopping button {button_id:02d}")
-            button.stop()
-        self.buttons.clear()
+        # No clear_buttons() here - the device is already gone
+        self._teardown_buttons()
+        self._blank_bytes = None
+        self._error_bytes = None
+        self._key_count = 0
         logger.debug("All buttons stopped and cleaned up")
     
     def _on_key_press(self, button_id: int):
@@ -334,41 +463,56 @@ class Coordinator:
             self.buttons[button_id].handle_press()
     
     def _handle_file_change(self, event):
-        """Called by FileWatcher when image or script files change.
+        """Called by FileWatcher with image and script changes of a button.
         
-        Simply tells the button that a file changed, button decides what to do.
+        Changes debounced together arrive as one batch. Each changed file is
+        passed to its button once and the button is redrawn at most once.
         """
-        file_path = event.data.get("path", "")
-        event_type = event.data.get("event_type", "")
-        
-        # Only handle relevant event types at the device level
-        if event_type not in ["modified", "moved", "created", "closed"]:
-            return
-        
-        button_id = extract_button_id_from_path(file_path, self.config_dir, self._get_key_count())
-        if not button_id or button_id not in self.buttons:
-            return
-            
-        filename = os.path.basename(file_path)
-        
-        # Button decides what to do with the changed file
-        file_handled = self.buttons[button_id].file_changed(filename)
+        key_count = self._get_key_count()
+        changed_files: Dict[int, List[str]] = {}
         
-        # If button says it was an image file, update display
-        if file_handled and filename.startswith("image."):
-            self.update_button_image(button_id)
+        for change in event.data.get('events', []):
+            # Only handle relevant event types at the device level
+            if change.get("event_type") not in ["modified", "moved", "created", "closed"]:
+                continue
+                
+            file_path = change.get("path", "")
+            button_id = extract_button_id_from_path(file_path, self.config_dir, key_count)
+            if not button_id or button_id not in self.buttons:
+                continue
+                
+            filenames = changed_files.setdefault(button_id, [])
+            filename = os.path.basename(file_path)
+            if filename not in filenames:
+                filenames.append(filename)
+        
+        for button_id, filenames in changed_files.items():
+            button = self.buttons.get(button_id)
+            if not button:
+                continue
+                
+            # Button decides what to do with each changed file
+            image_changed = False
+            for filename in filenames:
+                if button.file_changed(filename) and filename.startswith("image."):
+                    image_changed = True
+                    
+            # If button says the image content changed, queue redraw - render thread merges
+            # it with other requests and decodes only what changed
+            if image_changed:
+                self.request_redraw(button_id)
         
         
     def _handle_button_directories_changed(self, event):
         """Called by FileWatcher when button directories are created/deleted/renamed.
         
-        Stops file watching during reload to prevent infinite loops.
+        Events debounced together arrive as one batch, so the watcher is
+        restarted once per batch. Stops file watching during reload to prevent
+        infinite loops.
         """
-        event_type = event.data.get('event_type')
-        src_path = event.data.get('src_path')
-        dest_path = event.data.get('dest_path')
+        changes = event.data.get('events', [])
         
-        logger.debug(f"Button directories changed: {event_type}")
+        logger.debug(f"Button directories changed: {[change.get('event_type') for change in changes]}")
         
         # Critical: prevent infinite reload loops during button directory changes
         # File watcher must be stopped because reload operations trigger new filesystem events
@@ -376,7 +520,7 @@ class Coordinator:
         
         try:
             # Smart reload - only affected buttons
-            self._smart_reload_affected_buttons(event_type, src_path, dest_path)
+            self._smart_reload_affected_buttons(changes)
         finally:
             self.file_watcher.start_watching()
     
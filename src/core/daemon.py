@@ -1,4 +1,4 @@
-import time
+import threading
 import setproctitle
 from .coordinator import Coordinator
 from ..utils.config import CONFIG_DIR
@@ -17,6 +17,7 @@ class StreamDeckDaemon:
         self.config_dir = config_dir or CONFIG_DIR
         self.manager = None
         self.running = False
+        self.shutdown_event = threading.Event()
         
     def start(self):
         if self.running:
@@ -31,6 +32,7 @@ class StreamDeckDaemon:
         self.manager = Coordinator(self.config_dir)
         self.manager.initialize()
         
+        self.shutdown_event.clear()
         self.running = True
         logger.info(f"Daemon started. Monitoring directory: {self.config_dir}")
         logger.info("Daemon will automatically connect when Stream Deck is available")
@@ -46,13 +48,14 @@ class StreamDeckDaemon:
             self.manager.stop()
             
         self.running = False
+        self.shutdown_event.set()
         logger.info("Daemon stopped")
     
     def run(self):
         try:
             self.start()
-            while self.running:
-                time.sleep(1)
+            # Sleep until stop() - Ctrl+C still interrupts the wait
+            self.shutdown_event.wait()
         except KeyboardInterrupt:
             pass
         finally:
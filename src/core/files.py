@@ -90,7 +90,8 @@ class FileWatcher(FileSystemEventHandler):
                     "event_type": event.event_type,
                     "src_path": event.src_path
                 },
-                debounce_key=debounce_key
+                debounce_key=debounce_key,
+                accumulate=True
             )
             
     def _handle_directory_event(self, event):
@@ -126,7 +127,8 @@ class FileWatcher(FileSystemEventHandler):
                     "src_path": src_path,
                     "dest_path": dest_path
                 },
-                debounce_key=debounce_key
+                debounce_key=debounce_key,
+                accumulate=True
             )
             self.debouncer.debounce_interval = 0.5
             
@@ -154,9 +156,10 @@ class FileWatcher(FileSystemEventHandler):
             return False
             
     def _get_debounce_key(self, file_path: str) -> str:
-        """Groups related files under same debounce key to prevent rapid-fire events.
+        """Groups all files of a button under one debounce key to prevent rapid-fire events.
         
-        Button files use button-specific keys, config files use global keys.
+        Changes to several files of a button within the debounce interval are
+        delivered together, so the button is handled once per burst.
         """
         try:
             # Check if file_path is valid
@@ -178,10 +181,10 @@ class FileWatcher(FileSystemEventHandler):
             if not (len(button_dir) >= 2 and button_dir[:2].isdigit()):
                 return None
                 
-            # Create debounce key based on button and file type
+            # Only button files are watched, all share the button's key
             for file_type in self.file_types:
                 if filename.startswith(f"{file_type}."):
-                    return f"{button_dir}:{file_type}"
+                    return button_dir
                     
             return None
             
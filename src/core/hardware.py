@@ -1,7 +1,7 @@
 """Device hardware management for Stream Deck devices."""
 
 import threading
-from typing import Optional, Callable, Any
+from typing import Optional, Callable, Any, Dict
 from StreamDeck.DeviceManager import DeviceManager as SDKDeviceManager
 import pyudev
 from ..utils import logger
@@ -33,6 +33,9 @@ class DeviceHardwareManager:
         self.deck = None
         self.shutdown_requested = False
         
+        # Last image written to each key (0-based), to skip rewriting identical frames
+        self.key_images: Dict[int, bytes] = {}
+        
         # Device monitoring
         self.device_monitor_thread = None
         self.device_monitor_lock = threading.Lock()
@@ -104,13 +107,31 @@ class DeviceHardwareManager:
             key_index: Key index (0-based)
             image_bytes: Image data in device-native format
         """
-        if not self.is_connected():
+        self.set_key_images({key_index: image_bytes})
+        
+    def set_key_images(self, images: Dict[int, bytes]):
+        """Set images on several keys at once.
+        
+        Connection check enumerates HID devices, so it is done once per batch
+        instead of once per key. The deck's update lock is held for the whole
+        batch so writes from other threads can't interleave. Keys already
+        showing the same bytes are skipped.
+        
+        Args:
+            images: Key index (0-based) to image data in device-native format
+        """
+        if not images or not self.is_connected():
             return
             
         try:
-            self.deck.set_key_image(key_index, image_bytes)
+            with self.deck:
+                for key_index, image_bytes in images.items():
+                    if self.key_images.get(key_index) == image_bytes:
+                        continue
+                    self.deck.set_key_image(key_index, image_bytes)
+                    self.key_images[key_index] = image_bytes
         except Exception as e:
-            logger.error(f"Error setting key {key_index} image: {e}")
+            logger.error(f"Error setting key images {sorted(images)}: {e}")
     
     def apply_settings(self, brightness: int):
         """Apply device settings.
@@ -200,6 +221,7 @@ class DeviceHardwareManager:
                     
             device.open()
             device.reset()
+            self.key_images.clear()
             
             self.deck = device
             self.deck.set_key_callback(self._device_key_callback)
@@ -230,6 +252,7 @@ class DeviceHardwareManager:
                 logger.error(f"Error closing device: {e}")
             finally:
                 self.deck = None
+                self.key_images.clear()
     
     def _device_key_callback(self, deck, key, state):
         """Handle physical button press from device.
@@ -0,0 +1,189 @@
+"""Shared monitor for script processes of all buttons."""
+
+import os
+import selectors
+import threading
+from typing import List, Optional, Set, Tuple
+
+from ..utils import logger
+
+
+class ProcessMonitor:
+    """Watches processes of all registered ProcessManagers from a single thread.
+
+    Replaces one polling thread per button with one thread per daemon. The
+    thread is started on first registration and exits when the last manager
+    unregisters.
+
+    On Linux 5.3+ every watched process gets a pidfd which becomes readable
+    when the process exits, so the thread sleeps until something actually
+    exits. Without pidfd support all managers are polled every poll_interval.
+    """
+
+    def __init__(self, poll_interval: float = 1.0, use_pidfd: Optional[bool] = None):
+        """Initialize process monitor.
+
+        Args:
+            poll_interval: Seconds between process checks when polling
+            use_pidfd: Wait on pidfds instead of polling, None to auto-detect
+        """
+        self.poll_interval = poll_interval
+        self.use_pidfd = hasattr(os, 'pidfd_open') if use_pidfd is None else use_pidfd
+        self.managers: Set = set()
+        self.lock = threading.Lock()
+        self.thread: Optional[threading.Thread] = None
+
+        # Handed over to the monitor thread, which owns the selector
+        self.pending_pidfds: List[Tuple[int, object]] = []
+        self.pending_checks: Set = set()
+
+        # Self-pipe to interrupt select() on registration changes
+        self.wakeup_r, self.wakeup_w = os.pipe()
+        os.set_blocking(self.wakeup_r, False)
+        os.set_blocking(self.wakeup_w, False)
+
+    def register(self, manager):
+        """Start watching processes of a ProcessManager.
+
+        Args:
+            manager: ProcessManager to watch
+        """
+        with self.lock:
+            self.managers.add(manager)
+            # Catch processes that exited before they could be watched
+            self.pending_checks.add(manager)
+            if self.thread is None:
+                self.thread = threading.Thread(target=self._monitor_loop, daemon=True, name="ProcessMonitor")
+                self.thread.start()
+        self._wakeup()
+
+    def unregister(self, manager):
+        """Stop watching processes of a ProcessManager.
+
+        Args:
+            manager: ProcessManager to stop watching
+        """
+        with self.lock:
+            self.managers.discard(manager)
+            self.pending_checks.discard(manager)
+        # Let the idle thread exit now instead of after the next event
+        self._wakeup()
+
+    def is_registered(self, manager) -> bool:
+        with self.lock:
+            return manager in self.managers
+
+    def watch(self, manager, process):
+        """Get notified when a process started by manager exits.
+
+        Args:
+            manager: ProcessManager that owns the process
+            process: Started subprocess.Popen
+        """
+        if not self.use_pidfd:
+            return
+
+        try:
+            pidfd = os.pidfd_open(process.pid)
+        except ProcessLookupError:
+            # Already reaped (e.g. by poll() from another thread) - no pidfd
+            # event will come, so let the monitor thread collect it now
+            with self.lock:
+                if manager in self.managers:
+                    self.pending_checks.add(manager)
+            self._wakeup()
+            return
+        except OSError as e:
+            # Kernel without pidfd support - fall back to polling for good
+            logger.debug(f"pidfd_open failed ({e}), falling back to polling")
+            self.use_pidfd = False
+            self._wakeup()
+            return
+
+        with self.lock:
+            self.pending_pidfds.append((pidfd, manager))
+        self._wakeup()
+
+    def _wakeup(self):
+        try:
+            os.write(self.wakeup_w, b'\0')
+        except BlockingIOError:
+            # Pipe full - a wakeup is already pending
+            pass
+
+    def _monitor_loop(self):
+        """Check managers whose processes exited until none are left."""
+        selector = selectors.DefaultSelector()
+        selector.register(self.wakeup_r, selectors.EVENT_READ)
+        try:
+            while True:
+                with self.lock:
+                    if not self.managers:
+                        # Nobody left to notify - drop pidfds handed over meanwhile
+                        for pidfd, _ in self.pending_pidfds:
+                            os.close(pidfd)
+                        self.pending_pidfds = []
+                        self.thread = None
+                        return
+                    for pidfd, manager in self.pending_pidfds:
+                        selector.register(pidfd, selectors.EVENT_READ, manager)
+                    self.pending_pidfds = []
+
+                    if self.use_pidfd:
+                        to_check = self.pending_checks
+                    else:
+                        to_check = set(self.managers)
+                    self.pending_checks = set()
+
+                for manager in to_check:
+                    self._check_manager(manager)
+
+                timeout = None if self.use_pidfd else self.poll_interval
+                for key, _ in selector.select(timeout):
+                    if key.fd == self.wakeup_r:
+                        self._drain_wakeup()
+                        continue
+                    # Process exited - pidfd is done, let its manager collect it
+                    selector.unregister(key.fd)
+                    os.close(key.fd)
+                    with self.lock:
+                        if key.data in self.managers:
+                            self.pending_checks.add(key.data)
+        finally:
+            for key in list(selector.get_map().values()):
+                if key.fd != self.wakeup_r:
+                    os.close(key.fd)
+            selector.close()
+
+    def _check_manager(self, manager):
+        # One misbehaving button must not stop monitoring of the others
+        try:
+            manager.check_processes()
+        except Exception as e:
+            logger.error(f"Error monitoring processes in {manager.working_dir}: {e}")
+
+    def _drain_wakeup(self):
+        try:
+            while os.read(self.wakeup_r, 512):
+                pass
+        except BlockingIOError:
+            pass
+
+
+# Global ProcessMonitor instance - module-level singleton
+_monitor: Optional[ProcessMonitor] = None
+_monitor_lock = threading.Lock()
+
+
+def get_process_monitor() -> ProcessMonitor:
+    """Get global process monitor instance, creating it if necessary.
+
+    Returns:
+        ProcessMonitor: Global ProcessMonitor instance
+    """
+    global _monitor
+
+    with _monitor_lock:
+        if _monitor is None:
+            _monitor = ProcessMonitor()
+        return _monitor
@@ -8,6 +8,7 @@ import signal
 from typing import Dict, Optional, List
 from collections import defaultdict
 
+from .process_monitor import get_process_monitor
 from ..utils.config import SUPPORTED_SCRIPTS, get_config
 from ..utils.file_utils import find_file
 from ..utils import logger
@@ -30,8 +31,7 @@ class ProcessManager:
         # Unified callback
         self.on_script_completed = on_script_completed
         
-        # Background monitoring
-        self.monitor_thread: Optional[threading.Thread] = None
+        # Background monitoring is done by the shared ProcessMonitor thread
         self.monitoring = False
         
     def start_script(self, script_name: str, sync: bool = False) -> bool:
@@ -133,8 +133,7 @@ class ProcessManager:
             return
             
         self.monitoring = True
-        self.monitor_thread = threading.Thread(target=self._monitor_all_processes, daemon=True)
-        self.monitor_thread.start()
+        get_process_monitor().register(self)
         
     def stop_monitoring(self):
         """Stop background process monitoring."""
@@ -142,9 +141,7 @@ class ProcessManager:
             return
             
         self.monitoring = False
-        
-        if self.monitor_thread and self.monitor_thread.is_alive():
-            self.monitor_thread.join(timeout=2)
+        get_process_monitor().unregister(self)
     
     def cleanup(self):
         self.stop_monitoring()
@@ -211,11 +208,14 @@ class ProcessManager:
                     stdout=subprocess.PIPE,
                     stderr=subprocess.PIPE,
                     text=True,
-                    preexec_fn=os.setsid  # Create new session for child isolation
+                    # New session for child isolation - unlike preexec_fn=os.setsid this
+                    # keeps the fast vfork spawn path (Python 3.10+)
+                    start_new_session=True
                 )
                 
                 with self.lock:
                     self.processes[script_name] = process
+                get_process_monitor().watch(self, process)
                     
                 logger.debug(f"Started {script_name} script (PID: {process.pid})")
                 return True
@@ -224,26 +224,22 @@ class ProcessManager:
                 logger.error(f"Error starting {script_name} script: {e}")
                 return False
             
-    def _monitor_all_processes(self):
-        """Monitor all running processes and notify about completions.
+    def check_processes(self):
+        """Check all running processes and notify about completions.
         
-        Universal monitoring loop that checks all active processes.
+        Called by the shared ProcessMonitor thread when a process exits.
         """
-        while self.monitoring:
-            with self.lock:
-                # Check all running processes for completion
-                completed_processes = []
-                for script_name, process in list(self.processes.items()):
-                    exit_code = process.poll()
-                    if exit_code is not None:
-                        # Process completed
-                        completed_processes.append((script_name, exit_code))
-                        del self.processes[script_name]
-                        
-                # Notify about completed processes
-                for script_name, exit_code in completed_processes:
-                    if self.on_script_completed:
-                        self.on_script_completed(script_name, exit_code)
-                        
-            # Use threading.Event().wait() instead of time.sleep() for better thread responsiveness
-            threading.Event().wait(1)  # Check every second
+        with self.lock:
+            # Check all running processes for completion
+            completed_processes = []
+            for script_name, process in list(self.processes.items()):
+                exit_code = process.poll()
+                if exit_code is not None:
+                    # Process completed
+                    completed_processes.append((script_name, exit_code))
+                    del self.processes[script_name]
+                    
+            # Notify about completed processes
+            for script_name, exit_code in completed_processes:
+                if self.on_script_completed:
+                    self.on_script_completed(script_name, exit_code)
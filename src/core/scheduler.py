@@ -0,0 +1,98 @@
+"""Shared scheduler for delayed one-shot callbacks."""
+
+import heapq
+import itertools
+import threading
+import time
+from typing import Callable, List, Optional, Tuple
+
+from ..utils import logger
+
+
+class ScheduledCall:
+    """Handle of a scheduled callback, can be cancelled before it runs."""
+
+    def __init__(self, callback: Callable, args: tuple):
+        self.callback = callback
+        self.args = args
+        self.cancelled = False
+
+    def cancel(self):
+        """Prevent the callback from running if it hasn't run yet."""
+        self.cancelled = True
+
+
+class Scheduler:
+    """Runs delayed callbacks of all buttons from a single thread.
+
+    Replaces one threading.Timer (and so one thread) per delayed call. Calls
+    are kept in a heap ordered by deadline; the thread sleeps until the
+    earliest one is due or a new call is scheduled.
+    """
+
+    def __init__(self):
+        self.queue: List[Tuple[float, int, ScheduledCall]] = []
+        self.condition = threading.Condition()
+        self.counter = itertools.count()  # Keeps calls with equal deadlines in order
+        self.thread: Optional[threading.Thread] = None
+
+    def schedule(self, delay: float, callback: Callable, *args) -> ScheduledCall:
+        """Run callback after delay seconds.
+
+        Args:
+            delay: Seconds to wait
+            callback: Function to call
+            *args: Arguments for callback
+
+        Returns:
+            ScheduledCall: Handle to cancel the call
+        """
+        call = ScheduledCall(callback, args)
+        with self.condition:
+            heapq.heappush(self.queue, (time.monotonic() + delay, next(self.counter), call))
+            if self.thread is None:
+                self.thread = threading.Thread(target=self._run, daemon=True, name="Scheduler")
+                self.thread.start()
+            self.condition.notify()
+        return call
+
+    def _run(self):
+        """Wait for due calls and run them, one at a time."""
+        while True:
+            with self.condition:
+                while True:
+                    if not self.queue:
+                        self.condition.wait()
+                        continue
+                    timeout = self.queue[0][0] - time.monotonic()
+                    if timeout <= 0:
+                        break
+                    self.condition.wait(timeout)
+                _, _, call = heapq.heappop(self.queue)
+
+            if call.cancelled:
+                continue
+            # Callbacks run outside the lock so they can schedule new calls
+            try:
+                call.callback(*call.args)
+            except Exception as e:
+                logger.error(f"Error in scheduled callback {call.callback}: {e}")
+
+
+# Global Scheduler instance - module-level singleton
+_scheduler: Optional[Scheduler] = None
+_scheduler_lock = threading.Lock()
+
+
+def get_scheduler() -> Scheduler:
+    """Get global scheduler instance, creating it if necessary.
+
+    Returns:
+        Scheduler: Global Scheduler instance
+    """
+    global _scheduler
+
+    with _scheduler_lock:
+        if _scheduler is None:
+            _scheduler = Scheduler()
+        return _scheduler
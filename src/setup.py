@@ -349,9 +349,7 @@ class SetupManager:
             for i in range(1, count + 1):
                 folder_name = f"{i:02d}_blank"
                 folder_path = self.config_dir / folder_name
-                
-                if not folder_path.exists():
-                    folder_path.mkdir()
+                folder_path.mkdir(exist_ok=True)
                     
             print_success(f"Created {count} button folders")
             
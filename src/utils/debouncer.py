@@ -19,15 +19,20 @@ class Event:
 class Debouncer:
     """Centralized event bus with debouncing support."""
     
-    def __init__(self, debounce_interval: float = 0.5):
+    def __init__(self, debounce_interval: float = 0.5, max_wait: float = 2.0):
         """Initialize event bus.
         
         Args:
             debounce_interval: Time to wait before processing accumulated events
+            max_wait: Longest time an accumulated batch is held back while
+                new events keep arriving
         """
         self.debounce_interval = debounce_interval
+        self.max_wait = max_wait
         self.subscribers: Dict[str, List[Callable]] = defaultdict(list)
         self.pending_events: Dict[str, Event] = {}  # key -> latest event
+        self.pending_batches: Dict[str, List[Dict[str, Any]]] = {}  # key -> data of accumulated events
+        self.batch_deadlines: Dict[str, float] = {}  # key -> monotonic time the batch must be flushed by
         self.debounce_timers: Dict[str, threading.Timer] = {}
         self.lock = threading.RLock()
         
@@ -52,13 +57,16 @@ class Debouncer:
             if callback in self.subscribers[event_type]:
                 self.subscribers[event_type].remove(callback)
                 
-    def emit(self, event_type: str, data: Dict[str, Any], debounce_key: Optional[str] = None):
+    def emit(self, event_type: str, data: Dict[str, Any], debounce_key: Optional[str] = None,
+             accumulate: bool = False):
         """Emit event with optional debouncing.
         
         Args:
             event_type: Type of event
             data: Event data
             debounce_key: Key for debouncing (if None, no debouncing)
+            accumulate: Deliver data of all distinct events debounced under the
+                key as {"events": [data, ...]} instead of only the latest event
         """
         event = Event(event_type, data, time.time())
         
@@ -67,7 +75,7 @@ class Debouncer:
             self._emit_event(event)
         else:
             # Debounce the event
-            self._debounce_event(event, debounce_key)
+            self._debounce_event(event, debounce_key, accumulate)
             
     def _emit_event(self, event: Event):
         """Emit event to all subscribers.
@@ -85,24 +93,41 @@ class Debouncer:
             except Exception as e:
                 logger.error(f"Error in event callback for {event.type}: {e}")
                 
-    def _debounce_event(self, event: Event, debounce_key: str):
+    def _debounce_event(self, event: Event, debounce_key: str, accumulate: bool = False):
         """Debounce event by key.
         
         Args:
             event: Event to debounce
             debounce_key: Key for debouncing
+            accumulate: Collect data of all events instead of keeping the latest
         """
         with self.lock:
             # Cancel existing timer for this key
             if debounce_key in self.debounce_timers:
                 self.debounce_timers[debounce_key].cancel()
                 
+            if accumulate:
+                batch = self.pending_batches.setdefault(debounce_key, [])
+                # Repeats add nothing and would grow the batch while events keep coming
+                if event.data not in batch:
+                    batch.append(event.data)
+                event = Event(event.type, {"events": batch}, event.timestamp)
+                
             # Store latest event for this key
             self.pending_events[debounce_key] = event
             
+            delay = self.debounce_interval
+            if accumulate:
+                # A steady stream of events (e.g. a script rewriting its image)
+                # must not hold back the rest of the batch forever
+                now = time.monotonic()
+                deadline = self.batch_deadlines.setdefault(
+                    debounce_key, now + max(self.max_wait, self.debounce_interval))
+                delay = max(0.0, min(delay, deadline - now))
+            
             # Schedule new timer
             timer = threading.Timer(
-                self.debounce_interval,
+                delay,
                 self._process_debounced_event,
                 args=[debounce_key]
             )
@@ -118,6 +143,8 @@ class Debouncer:
         with self.lock:
             # Get and remove pending event
             event = self.pending_events.pop(debounce_key, None)
+            self.pending_batches.pop(debounce_key, None)
+            self.batch_deadlines.pop(debounce_key, None)
             self.debounce_timers.pop(debounce_key, None)
             
         if event:
@@ -130,4 +157,6 @@ class Debouncer:
                 timer.cancel()
             self.debounce_timers.clear()
             self.pending_events.clear()
+            self.pending_batches.clear()
+            self.batch_deadlines.clear()
             self.subscribers.clear()
\ No newline at end of file
@@ -1,5 +1,6 @@
 """File utility functions."""
 
+import functools
 import os
 from typing import List, Optional, Dict
 from . import logger
@@ -39,17 +40,21 @@ def find_any_file(directory: str, prefix: str) -> Optional[str]:
     if not os.path.isdir(directory):
         return None
         
-    for filename in os.listdir(directory):
-        if filename.startswith(f"{prefix}."):
-            full_path = os.path.join(directory, filename)
-            if os.path.isfile(full_path) or os.path.islink(full_path):
-                return full_path
+    # DirEntry knows its type from the listing, only symlinks need a stat
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if entry.name.startswith(f"{prefix}.") and (entry.is_file() or entry.is_symlink()):
+                return entry.path
     return None
 
 
+@functools.lru_cache(maxsize=1024)
 def extract_button_id_from_path(file_path: str, config_dir: str, max_buttons: int) -> int:
     """Extract button ID from file or directory path.
     
+    Purely path-based, so results are cached - editors write the same files
+    over and over. The filesystem is never consulted.
+    
     Args:
         file_path: File or directory path
         config_dir: Configuration directory path
@@ -59,13 +64,14 @@ def extract_button_id_from_path(file_path: str, config_dir: str, max_buttons: in
         int: Button ID (1-based) or 0 if not found
     """
     try:
-        if os.path.isfile(file_path) or '.' in os.path.basename(file_path):
-            dir_path = os.path.dirname(file_path)
-        else:
-            dir_path = file_path
-            
-        rel_path = os.path.relpath(dir_path, config_dir)
-        dir_name = rel_path.split(os.sep)[0]  # Get first part of relative path
+        rel_path = os.path.relpath(file_path, config_dir)
+        path_parts = rel_path.split(os.sep)
+        
+        # A single part with an extension is a file in config_dir itself,
+        # otherwise the first part is the button folder
+        if len(path_parts) == 1 and '.' in path_parts[0]:
+            return 0
+        dir_name = path_parts[0]
         
         if len(dir_name) >= 2 and dir_name[:2].isdigit():
             button_id = int(dir_name[:2])
@@ -92,12 +98,15 @@ def find_button_directories(config_dir: str, max_buttons: int) -> Dict[int, str]
     if not os.path.isdir(config_dir):
         return button_dirs
         
-    for item in os.listdir(config_dir):
-        item_path = os.path.join(config_dir, item)
-        if os.path.isdir(item_path) and len(item) >= 2 and item[:2].isdigit():
-            button_id = int(item[:2])
-            if 1 <= button_id <= max_buttons:
-                button_dirs[button_id] = item
+    # scandir gets the file type from the directory listing, no stat per entry
+    with os.scandir(config_dir) as entries:
+        for entry in entries:
+            item = entry.name
+            if len(item) >= 2 and item[:2].isdigit() and entry.is_dir():
+                button_id = int(item[:2])
+                # First match wins, same as find_button_working_dir()
+                if 1 <= button_id <= max_buttons and button_id not in button_dirs:
+                    button_dirs[button_id] = item
                 
     return button_dirs
 
@@ -117,8 +126,9 @@ def find_button_working_dir(config_dir: str, button_id: int) -> Optional[str]:
         
     button_prefix = f"{button_id:02d}"
     
-    for item in os.listdir(config_dir):
-        if item.startswith(button_prefix) and os.path.isdir(os.path.join(config_dir, item)):
-            return os.path.join(config_dir, item)
+    with os.scandir(config_dir) as entries:
+        for entry in entries:
+            if entry.name.startswith(button_prefix) and entry.is_dir():
+                return entry.path
             
     return None
\ No newline at end of file
@@ -1,6 +1,8 @@
 """Image utility functions for Stream Deck operations."""
 
 import os
+import threading
+from collections import OrderedDict
 from typing import Optional
 from PIL import Image
 from StreamDeck.ImageHelpers import PILHelper
@@ -12,6 +14,12 @@ class ImageCache:
     
     _blank_image: Optional[Image.Image] = None
     _error_image: Optional[Image.Image] = None
+    
+    # Device-native bytes of button images, least recently used first.
+    # Key: (path, inode, mtime_ns, size, deck type) - any file change is a miss
+    _prepared: "OrderedDict[tuple, bytes]" = OrderedDict()
+    _prepared_limit = 128
+    _prepared_lock = threading.Lock()
 
 
 def load_blank_image() -> Optional[Image.Image]:
@@ -25,7 +33,11 @@ def load_blank_image() -> Optional[Image.Image]:
             # Navigate up from src/utils/image_utils.py to find project root
             project_root = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
             blank_path = os.path.join(project_root, 'resources', 'blank.png')
-            ImageCache._blank_image = Image.open(blank_path)
+            image = Image.open(blank_path)
+            # Decode now - a lazily loaded image shared between threads
+            # would be decoded on first use, possibly twice at once
+            image.load()
+            ImageCache._blank_image = image
             logger.debug(f"Blank image loaded: {blank_path}")
         except Exception as e:
             logger.error(f"Error loading blank image: {e}")
@@ -44,7 +56,9 @@ def load_error_image() -> Optional[Image.Image]:
             # Navigate up from src/utils/image_utils.py to find project root
             project_root = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
             error_path = os.path.join(project_root, 'resources', 'error.png')
-            ImageCache._error_image = Image.open(error_path)
+            image = Image.open(error_path)
+            image.load()  # Decode now, see load_blank_image()
+            ImageCache._error_image = image
             logger.debug(f"Error image loaded: {error_path}")
         except Exception as e:
             logger.error(f"Error loading error image: {e}")
@@ -71,3 +85,47 @@ def prepare_image_for_deck(deck, image: Image.Image) -> Optional[bytes]:
         return None
 
 
+def prepare_image_file_for_deck(deck, image_path: str) -> Optional[bytes]:
+    """Load image file and prepare it for Stream Deck device, with caching.
+    
+    Redraws of an unchanged file reuse the previously prepared bytes instead
+    of decoding, scaling and converting the image again.
+    
+    Args:
+        deck: Stream Deck device instance
+        image_path: Path to image file (symlinks already resolved)
+        
+    Returns:
+        Optional[bytes]: Image data in device-native format or None if failed
+    """
+    try:
+        st = os.stat(image_path)
+    except OSError as e:
+        logger.error(f"Error loading image {image_path}: {e}")
+        return None
+    
+    key = (image_path, st.st_ino, st.st_mtime_ns, st.st_size, deck.deck_type())
+    with ImageCache._prepared_lock:
+        image_bytes = ImageCache._prepared.get(key)
+        if image_bytes is not None:
+            ImageCache._prepared.move_to_end(key)
+            return image_bytes
+    
+    try:
+        with Image.open(image_path) as image:
+            # JPEG only: let the decoder downscale by a power of two while
+            # decoding, keeping at least twice the key size for the final resize
+            width, height = deck.key_image_format()['size']
+            image.draft("RGB", (width * 2, height * 2))
+            image_bytes = prepare_image_for_deck(deck, image)
+    except Exception as e:
+        logger.error(f"Error loading image {image_path}: {e}")
+        return None
+    
+    if image_bytes:
+        logger.debug(f"Image loaded: {image_path}")
+        with ImageCache._prepared_lock:
+            ImageCache._prepared[key] = image_bytes
+            if len(ImageCache._prepared) > ImageCache._prepared_limit:
+                ImageCache._prepared.popitem(last=False)
+    return image_bytes
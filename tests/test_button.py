@@ -76,6 +76,18 @@ class TestButton(unittest.TestCase):
             mock_start.assert_called_once_with("background")
             mock_start_monitoring.assert_called_once()
             
+    def test_start_registers_before_spawning(self):
+        """Test that monitoring starts before the background script is spawned."""
+        calls = []
+        with patch.object(self.button.process_manager, 'is_running', return_value=False), \
+             patch.object(self.button.process_manager, 'start_script_async',
+                          side_effect=lambda name: calls.append(name)), \
+             patch.object(self.button.process_manager, 'start_monitoring',
+                          side_effect=lambda: calls.append("monitoring")):
+            self.button.start()
+            
+        self.assertEqual(calls, ["monitoring", "background"])
+            
     def test_start_button_already_running(self):
         """Test starting button when already running."""
         self.button.running = True
@@ -139,6 +151,21 @@ class TestButton(unittest.TestCase):
         found_path = self.button._find_image_file()
         self.assertIsNone(found_path)
         
+    def test_find_image_file_cached_until_image_changed(self):
+        """Test that image path is cached and rescanned after image change."""
+        image_path = self._create_file("image.png", "binary data")
+        self.assertEqual(self.button._find_image_file(), image_path)
+        
+        with patch('src.core.button.find_any_file') as mock_find:
+            self.assertEqual(self.button._find_image_file(), image_path)
+            mock_find.assert_not_called()
+            
+        os.remove(image_path)
+        jpg_path = self._create_file("image.jpg", "binary data")
+        self.button.file_changed("image.jpg")
+        
+        self.assertEqual(self.button._find_image_file(), jpg_path)
+        
     def test_find_image_file_invalid_permissions(self):
         """Test finding image file with invalid permissions."""
         # Create image file with no read permissions
@@ -225,6 +252,19 @@ class TestButton(unittest.TestCase):
         handled = self.button.file_changed("image.gif")
         self.assertTrue(handled)
     
+    def test_file_changed_image_same_content(self):
+        """Test that rewriting the image with the same content is ignored."""
+        image_path = self._create_file("image.png", "png data")
+        self.assertTrue(self.button.file_changed("image.png"))
+        
+        # Same content saved again
+        os.remove(image_path)
+        self._create_file("image.png", "png data")
+        self.assertFalse(self.button.file_changed("image.png"))
+        
+        self._create_file("image.png", "new png data")
+        self.assertTrue(self.button.file_changed("image.png"))
+    
     def test_file_changed_invalid_files(self):
         """Test handling invalid file changes."""
         # Test various invalid file names
@@ -253,8 +293,9 @@ class TestButton(unittest.TestCase):
         mock_image = unittest.mock.Mock(spec=Image.Image)
         
         with patch.object(self.button, '_find_image_file', return_value="/path/to/image.png"), \
+             patch('os.lstat'), \
+             patch('os.stat'), \
              patch('os.path.realpath', return_value="/path/to/image.png"), \
-             patch('os.path.exists', return_value=True), \
              patch('PIL.Image.open', return_value=mock_image):
             
             result = self.button.get_image()
@@ -262,6 +303,42 @@ class TestButton(unittest.TestCase):
         self.assertEqual(result, mock_image)
         self.assertFalse(self.button.failed)
             
+    def test_get_image_path_resolves_symlink_once(self):
+        """Test that an unchanged symlink is not resolved again."""
+        self._create_file("a.png", "a")
+        self._create_file("b.png", "b")
+        os.symlink("a.png", os.path.join(self.temp_dir, "image.png"))
+        expected = os.path.realpath(os.path.join(self.temp_dir, "a.png"))
+        
+        self.assertEqual(self.button.get_image_path(), expected)
+        with patch('os.path.realpath') as mock_realpath:
+            self.assertEqual(self.button.get_image_path(), expected)
+            mock_realpath.assert_not_called()
+            
+        # Switching the link is picked up after the file change event
+        os.remove(os.path.join(self.temp_dir, "image.png"))
+        os.symlink("b.png", os.path.join(self.temp_dir, "image.png"))
+        self.button.file_changed("image.png")
+        
+        expected = os.path.realpath(os.path.join(self.temp_dir, "b.png"))
+        self.assertEqual(self.button.get_image_path(), expected)
+        
+    def test_get_image_path_follows_repointed_chain(self):
+        """Test that re-pointing a link further down a chain is picked up."""
+        self._create_file("a.png", "a")
+        self._create_file("b.png", "b")
+        current = os.path.join(self.temp_dir, "current.png")
+        os.symlink("a.png", current)
+        os.symlink("current.png", os.path.join(self.temp_dir, "image.png"))
+        
+        self.assertEqual(self.button.get_image_path(), os.path.realpath(os.path.join(self.temp_dir, "a.png")))
+        
+        # No image.* event - only current.png changes
+        os.remove(current)
+        os.symlink("b.png", current)
+        
+        self.assertEqual(self.button.get_image_path(), os.path.realpath(os.path.join(self.temp_dir, "b.png")))
+            
     def test_reload_button(self):
         """Test reloading button configuration."""
         # Start button first
@@ -277,10 +354,22 @@ class TestButton(unittest.TestCase):
             mock_load.assert_called_once()
             mock_start.assert_called_once()
             
+    def test_reload_keeps_process_manager(self):
+        """Test that reload reuses the existing ProcessManager."""
+        process_manager = self.button.process_manager
+        self.button.start()
+        
+        self.button.reload()
+        
+        self.assertIs(self.button.process_manager, process_manager)
+        self.assertTrue(process_manager.monitoring)
+        self.button.stop()
+            
     def test_on_script_completed_background_success(self):
         """Test callback when background script crashes but restart succeeds."""
         # Set initial failed state to test clearing
         self.button.failed = True
+        self.button.running = True
         
         with patch.object(self.button.process_manager, 'start_script_async', return_value=True):
             # When restart succeeds, button should clear error
@@ -293,6 +382,7 @@ class TestButton(unittest.TestCase):
         """Test callback when background script crashes and restart fails."""
         mock_request_redraw = unittest.mock.Mock()
         self.button.request_redraw = mock_request_redraw
+        self.button.running = True
         
         with patch.object(self.button.process_manager, 'start_script_async', return_value=False):
             # When restart fails, button should show error
@@ -303,6 +393,39 @@ class TestButton(unittest.TestCase):
         self.assertTrue(self.button.failed)
         self.assertGreaterEqual(mock_request_redraw.call_count, 1)
             
+    def test_background_crash_limit(self):
+        """Test that restarts stop after too many crashes within the window."""
+        self.button.running = True
+        with patch('src.core.button.get_scheduler') as mock_get_scheduler:
+            for _ in range(self.button.restart_limits):
+                self.button._on_script_completed("background", 1)
+            self.assertFalse(self.button.failed)
+            self.assertEqual(mock_get_scheduler.return_value.schedule.call_count, self.button.restart_limits)
+            
+            # Restart delay doubles with every crash in the window
+            delays = [c.args[0] for c in mock_get_scheduler.return_value.schedule.call_args_list]
+            self.assertEqual(delays, [2.0, 4.0, 8.0, 16.0, 32.0])
+            
+            self.button._on_script_completed("background", 1)
+            
+        self.assertTrue(self.button.failed)
+        self.assertEqual(len(self.button.background_crash_timestamps), self.button.restart_limits + 1)
+        
+    def test_background_crash_window_expires(self):
+        """Test that crashes older than the restart window are forgotten."""
+        self.button.running = True
+        with patch('src.core.button.get_scheduler'), \
+             patch('time.monotonic', return_value=1000.0):
+            for _ in range(self.button.restart_limits):
+                self.button._on_script_completed("background", 1)
+                
+        with patch('src.core.button.get_scheduler'), \
+             patch('time.monotonic', return_value=1000.0 + self.button.restart_window):
+            self.button._on_script_completed("background", 1)
+            
+        self.assertFalse(self.button.failed)
+        self.assertEqual(len(self.button.background_crash_timestamps), 1)
+            
     def test_on_script_completed_action_success(self):
         """Test callback when action script completes successfully."""
         # When action succeeds (exit code 0), button should not show error
@@ -410,6 +533,7 @@ class TestButton(unittest.TestCase):
         """Test callback when action script fails with temporary error display."""
         mock_request_redraw = unittest.mock.Mock()
         self.button.request_redraw = mock_request_redraw
+        self.button.running = True
         
         # When action fails (non-zero exit code), button should show temporary error
         self.button._on_script_completed("action", 1)
@@ -421,7 +545,53 @@ class TestButton(unittest.TestCase):
         time.sleep(2.1)
         self.assertFalse(self.button.failed)
         self.assertEqual(mock_request_redraw.call_count, 2)
-
+        
+    def test_set_failed_redraws_only_on_change(self):
+        """Test that unchanged error state doesn't request a redraw."""
+        mock_request_redraw = unittest.mock.Mock()
+        self.button.request_redraw = mock_request_redraw
+        
+        self.button.set_failed(False)
+        self.assertEqual(mock_request_redraw.call_count, 0)
+        
+        self.button.set_failed(True)
+        self.button.set_failed(True)
+        self.assertEqual(mock_request_redraw.call_count, 1)
+        
+    def test_stop_cancels_pending_timers(self):
+        """Test that stopping the button cancels delayed error reset."""
+        mock_request_redraw = unittest.mock.Mock()
+        self.button.request_redraw = mock_request_redraw
+        self.button.running = True
+        
+        self.button._on_script_completed("action", 1)
+        call = self.button._error_clear_call
+        self.button.stop()
+        
+        self.assertTrue(call.cancelled)
+        self.assertTrue(self.button.failed)
+        self.assertEqual(mock_request_redraw.call_count, 1)
+        
+    def test_exit_reported_during_stop_ignored(self):
+        """Test that a background exit reported after stop() doesn't respawn it."""
+        with patch('src.core.button.get_scheduler') as mock_get_scheduler, \
+             patch.object(self.button.process_manager, 'start_script_async') as mock_start:
+            self.button._on_script_completed("background", 1)
+            
+        mock_get_scheduler.return_value.schedule.assert_not_called()
+        mock_start.assert_not_called()
+        
+    def test_restart_after_stop_ignored(self):
+        """Test that a restart already due when stop() runs doesn't respawn the script."""
+        self.button.running = True
+        with patch('src.core.button.get_scheduler') as mock_get_scheduler:
+            self.button._on_script_completed("background", 1)
+        restart = mock_get_scheduler.return_value.schedule.call_args[0][1]
+        self.button.stop()
+        
+        with patch.object(self.button.process_manager, 'start_script_async') as mock_start:
+            restart()
+        mock_start.assert_not_called()
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,156 @@
+"""Tests for Coordinator render path."""
+
+import shutil
+import tempfile
+import threading
+import time
+import unittest
+from unittest.mock import Mock, patch
+
+from src.core.coordinator import Coordinator
+from src.utils.config import reset_config
+
+
+class TestCoordinatorRender(unittest.TestCase):
+    """Test cases for batched button rendering in Coordinator."""
+    
+    def setUp(self):
+        """Set up coordinator with fake hardware and a running render thread."""
+        self.temp_dir = tempfile.mkdtemp()
+        reset_config()
+        self.coordinator = Coordinator(self.temp_dir)
+        
+        self.hardware = Mock()
+        self.hardware.is_connected.return_value = True
+        self.coordinator.hardware = self.hardware
+        
+        for button_id in (1, 2, 3):
+            button = Mock()
+            button.get_image_path.return_value = f"/images/{button_id}.png"
+            self.coordinator.buttons[button_id] = button
+            
+        patcher = patch('src.core.coordinator.prepare_image_file_for_deck',
+                        side_effect=lambda deck, path: path.encode())
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        
+        self.coordinator.render_thread = threading.Thread(target=self.coordinator._render_loop, daemon=True)
+        self.coordinator.render_thread.start()
+        
+    def tearDown(self):
+        """Stop render thread and clean up."""
+        self.coordinator.shutdown_requested = True
+        self.coordinator.redraw_queue.put(None)
+        self.coordinator.render_thread.join(timeout=1)
+        self.coordinator.debouncer.shutdown()
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+        reset_config()
+        
+    def test_burst_written_in_one_batch(self):
+        """Test that redraw requests within the coalesce window are one device write."""
+        for button_id in (1, 2, 1, 3, 2):
+            self.coordinator.request_redraw(button_id)
+            
+        time.sleep(0.1)
+        
+        self.hardware.set_key_images.assert_called_once_with({
+            0: b"/images/1.png",
+            1: b"/images/2.png",
+            2: b"/images/3.png",
+        })
+        
+    def test_separate_bursts_written_separately(self):
+        """Test that requests after the window start a new batch."""
+        self.coordinator.request_redraw(1)
+        time.sleep(0.1)
+        self.coordinator.request_redraw(2)
+        time.sleep(0.1)
+        
+        self.assertEqual(self.hardware.set_key_images.call_count, 2)
+        self.assertEqual(self.hardware.set_key_images.call_args_list[1][0][0], {1: b"/images/2.png"})
+        
+    def test_removed_button_skipped(self):
+        """Test that a button removed before rendering doesn't break the batch."""
+        del self.coordinator.buttons[2]
+        for button_id in (1, 2):
+            self.coordinator.request_redraw(button_id)
+            
+        time.sleep(0.1)
+        
+        self.hardware.set_key_images.assert_called_once_with({0: b"/images/1.png"})
+        
+    def test_failed_reload_rendered_through_queue(self):
+        """Test that a button failing to load shows the error image via the render thread."""
+        failed_button = Mock()
+        failed_button.load_config.return_value = False
+        failed_button.get_image_path.return_value = None
+        
+        with patch('src.core.coordinator.find_button_working_dir', return_value="/config/04"), \
+             patch('src.core.coordinator.Button', return_value=failed_button), \
+             patch.object(self.coordinator, '_get_error_image_bytes', return_value=b"error"):
+            self.coordinator.reload_button(4)
+            time.sleep(0.1)
+            
+        failed_button.start.assert_not_called()
+        self.hardware.set_key_images.assert_called_once_with({3: b"error"})
+        
+    def test_disconnected_device_not_written(self):
+        """Test that nothing is rendered without a connected device."""
+        self.hardware.is_connected.return_value = False
+        self.coordinator.request_redraw(1)
+        
+        time.sleep(0.1)
+        
+        self.hardware.set_key_images.assert_not_called()
+        self.coordinator.buttons[1].get_image_path.assert_not_called()
+
+
+
+class TestCoordinatorStopButtons(unittest.TestCase):
+    """Test cases for stopping buttons in parallel."""
+    
+    def setUp(self):
+        """Set up coordinator."""
+        self.temp_dir = tempfile.mkdtemp()
+        reset_config()
+        self.coordinator = Coordinator(self.temp_dir)
+        
+    def tearDown(self):
+        """Clean up test environment."""
+        self.coordinator.debouncer.shutdown()
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+        reset_config()
+        
+    def _slow_button(self, delay: float) -> Mock:
+        button = Mock(running=True)
+        button.stop.side_effect = lambda: time.sleep(delay)
+        return button
+        
+    def test_buttons_stopped_in_parallel(self):
+        """Test that slow buttons are stopped concurrently, skipping stopped ones."""
+        buttons = [self._slow_button(0.3) for _ in range(4)]
+        idle = Mock(running=False)
+        
+        start = time.monotonic()
+        self.coordinator._stop_buttons(buttons + [idle])
+        elapsed = time.monotonic() - start
+        
+        self.assertLess(elapsed, 0.9)
+        for button in buttons:
+            button.stop.assert_called_once()
+        idle.stop.assert_not_called()
+        
+    def test_hung_button_does_not_block(self):
+        """Test that waiting for buttons gives up after the timeout."""
+        buttons = [self._slow_button(2.0), self._slow_button(0.0)]
+        
+        start = time.monotonic()
+        with patch('src.core.coordinator.STOP_TIMEOUT', 0.2):
+            self.coordinator._stop_buttons(buttons)
+            
+        self.assertLess(time.monotonic() - start, 1.0)
+        buttons[1].stop.assert_called_once()
+
+
+if __name__ == '__main__':
+    unittest.main()
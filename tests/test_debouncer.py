@@ -129,6 +129,34 @@ class TestDebouncer(unittest.TestCase):
         event = self.mock_callback.call_args[0][0]
         self.assertEqual(event.data, {"count": 3})
         
+    def test_emit_debounced_accumulate(self):
+        """Test accumulated debounced events are delivered as one batch."""
+        self.debouncer.subscribe("TEST_EVENT", self.mock_callback)
+        
+        self.debouncer.emit("TEST_EVENT", {"count": 1}, debounce_key="test_key", accumulate=True)
+        self.debouncer.emit("TEST_EVENT", {"count": 2}, debounce_key="test_key", accumulate=True)
+        
+        time.sleep(0.15)
+        
+        self.mock_callback.assert_called_once()
+        event = self.mock_callback.call_args[0][0]
+        self.assertEqual(event.data, {"events": [{"count": 1}, {"count": 2}]})
+        self.assertEqual(self.debouncer.pending_batches, {})
+        
+    def test_emit_debounced_accumulate_max_wait(self):
+        """Test that a steady stream of events doesn't hold back a batch forever."""
+        self.debouncer.max_wait = 0.3
+        self.debouncer.subscribe("TEST_EVENT", self.mock_callback)
+        
+        # Events every 50ms never leave a 100ms quiet gap
+        for i in range(10):
+            self.debouncer.emit("TEST_EVENT", {"count": i}, debounce_key="test_key", accumulate=True)
+            time.sleep(0.05)
+            
+        self.assertGreaterEqual(self.mock_callback.call_count, 1)
+        first_batch = self.mock_callback.call_args_list[0][0][0].data["events"]
+        self.assertEqual(first_batch[0], {"count": 0})
+        
     def test_emit_debounced_multiple_events_different_keys(self):
         """Test multiple debounced events with different keys."""
         self.debouncer.subscribe("TEST_EVENT", self.mock_callback)
@@ -9,7 +9,7 @@ from unittest.mock import Mock, patch, MagicMock
 from watchdog.events import FileCreatedEvent, FileDeletedEvent, FileModifiedEvent, DirCreatedEvent, DirDeletedEvent, DirMovedEvent
 
 from src.core.files import FileWatcher
-from src.utils.file_utils import find_file, find_any_file
+from src.utils.file_utils import find_file, find_any_file, find_button_directories, extract_button_id_from_path
 from src.utils.debouncer import Debouncer
 
 
@@ -171,6 +171,32 @@ class TestFileUtils(unittest.TestCase):
         result = find_file(self.temp_dir, "Action", ["py"])
         expected = os.path.join(self.temp_dir, "Action.py")
         self.assertEqual(result, expected)
+        
+    def test_find_button_directories(self):
+        """Test mapping button IDs to directories in one listing."""
+        os.mkdir(os.path.join(self.temp_dir, "01_volume"))
+        os.mkdir(os.path.join(self.temp_dir, "03"))
+        os.mkdir(os.path.join(self.temp_dir, "16"))
+        os.mkdir(os.path.join(self.temp_dir, "notes"))
+        self._create_file("02")
+        self._create_file("config.yaml")
+        
+        result = find_button_directories(self.temp_dir, 15)
+        self.assertEqual(result, {1: "01_volume", 3: "03"})
+        
+    def test_extract_button_id_from_path(self):
+        """Test button ID extraction doesn't depend on what exists on disk."""
+        config_dir = self.temp_dir
+        
+        self.assertEqual(extract_button_id_from_path(os.path.join(config_dir, "01_vol", "update"), config_dir, 15), 1)
+        self.assertEqual(extract_button_id_from_path(os.path.join(config_dir, "02_mic", "image.png"), config_dir, 15), 2)
+        self.assertEqual(extract_button_id_from_path(os.path.join(config_dir, "03"), config_dir, 15), 3)
+        self.assertEqual(extract_button_id_from_path(os.path.join(config_dir, "config.yaml"), config_dir, 15), 0)
+        self.assertEqual(extract_button_id_from_path(os.path.join(config_dir, "16", "image.png"), config_dir, 15), 0)
+        
+        # Same answer after the path appears as a directory
+        os.makedirs(os.path.join(config_dir, "01_vol", "update"))
+        self.assertEqual(extract_button_id_from_path(os.path.join(config_dir, "01_vol", "update"), config_dir, 15), 1)
 
 
 class TestFileWatcher(unittest.TestCase):
@@ -213,7 +239,7 @@ class TestFileWatcher(unittest.TestCase):
         file_path = os.path.join(button_dir, "image.png")
         
         key = self.file_watcher._get_debounce_key(file_path)
-        self.assertEqual(key, "01_test:image")
+        self.assertEqual(key, "01_test")
         
     def test_get_debounce_key_script_files(self):
         """Test debounce key generation for script files."""
@@ -223,9 +249,9 @@ class TestFileWatcher(unittest.TestCase):
         background_path = os.path.join(button_dir, "background.sh")
         update_path = os.path.join(button_dir, "update.js")
         
-        self.assertEqual(self.file_watcher._get_debounce_key(action_path), "05:action")
-        self.assertEqual(self.file_watcher._get_debounce_key(background_path), "05:background")
-        self.assertEqual(self.file_watcher._get_debounce_key(update_path), "05:update")
+        self.assertEqual(self.file_watcher._get_debounce_key(action_path), "05")
+        self.assertEqual(self.file_watcher._get_debounce_key(background_path), "05")
+        self.assertEqual(self.file_watcher._get_debounce_key(update_path), "05")
         
     def test_get_debounce_key_unsupported_file(self):
         """Test debounce key for unsupported files."""
@@ -319,7 +345,7 @@ class TestFileWatcher(unittest.TestCase):
         
         # Verify callback was called
         self.file_callback.assert_called_once()
-        event_data = self.file_callback.call_args[0][0].data
+        event_data, = self.file_callback.call_args[0][0].data["events"]
         self.assertEqual(event_data["path"], file_path)
         self.assertEqual(event_data["event_type"], "modified")
         
@@ -338,7 +364,7 @@ class TestFileWatcher(unittest.TestCase):
         
         # Verify callback was called
         self.dir_callback.assert_called_once()
-        event_data = self.dir_callback.call_args[0][0].data
+        event_data, = self.dir_callback.call_args[0][0].data["events"]
         self.assertEqual(event_data["src_path"], dir_path)
         self.assertEqual(event_data["event_type"], "created")
         
@@ -374,7 +400,7 @@ class TestFileWatcher(unittest.TestCase):
         
         # Verify callback was called
         self.dir_callback.assert_called_once()
-        event_data = self.dir_callback.call_args[0][0].data
+        event_data, = self.dir_callback.call_args[0][0].data["events"]
         self.assertEqual(event_data["src_path"], src_path)
         self.assertEqual(event_data["dest_path"], dest_path)
         self.assertEqual(event_data["event_type"], "moved")
@@ -438,6 +464,40 @@ class TestFileWatcher(unittest.TestCase):
         # Should only receive one callback
         self.file_callback.assert_called_once()
         
+    def test_file_events_grouped_by_button(self):
+        """Test that changes to several files of a button arrive in one batch."""
+        button_dir = self._create_button_dir(1)
+        image_path = os.path.join(button_dir, "image.png")
+        update_path = os.path.join(button_dir, "update.sh")
+        
+        for file_path in (image_path, update_path, image_path):
+            self.file_watcher.on_any_event(FileModifiedEvent(file_path))
+            
+        time.sleep(0.1)
+        
+        self.file_callback.assert_called_once()
+        events = self.file_callback.call_args[0][0].data["events"]
+        self.assertEqual([event["path"] for event in events], [image_path, update_path])
+        
+    def test_script_change_delivered_during_image_stream(self):
+        """Test that a script edit isn't starved by a script rewriting its image."""
+        self.debouncer.max_wait = 0.2
+        button_dir = self._create_button_dir(1)
+        image_path = os.path.join(button_dir, "image.png")
+        action_path = os.path.join(button_dir, "action.sh")
+        
+        # Image rewritten every 20ms, faster than the 50ms debounce interval
+        for i in range(25):
+            self.file_watcher.on_any_event(FileModifiedEvent(image_path))
+            if i == 3:
+                self.file_watcher.on_any_event(FileModifiedEvent(action_path))
+            time.sleep(0.02)
+            
+        delivered = [event["path"]
+                     for call in self.file_callback.call_args_list
+                     for event in call[0][0].data["events"]]
+        self.assertIn(action_path, delivered)
+        
     def test_skip_opened_closed_events(self):
         """Test that opened/closed events are skipped."""
         from watchdog.events import FileOpenedEvent, FileClosedEvent
@@ -0,0 +1,72 @@
+"""Tests for DeviceHardwareManager key writes."""
+
+import unittest
+from unittest.mock import MagicMock, Mock, patch
+
+from src.core.hardware import DeviceHardwareManager
+
+
+class TestKeyImageWrites(unittest.TestCase):
+    """Test cases for skipping identical key images."""
+    
+    def setUp(self):
+        """Set up hardware manager with a connected mock deck."""
+        self.hardware = DeviceHardwareManager(on_connect=Mock(), on_disconnect=Mock(), on_key_press=Mock())
+        self.deck = self._make_deck()
+        self.hardware.deck = self.deck
+        
+    def _make_deck(self):
+        deck = MagicMock()
+        deck.connected.return_value = True
+        deck.is_open.return_value = True
+        deck.key_count.return_value = 15
+        return deck
+        
+    def test_identical_image_skipped(self):
+        """Test that writing the same bytes to a key again is skipped."""
+        self.hardware.set_key_images({0: b"a", 1: b"b"})
+        self.hardware.set_key_images({0: b"a", 1: b"c"})
+        
+        writes = [c.args for c in self.deck.set_key_image.call_args_list]
+        self.assertEqual(writes, [(0, b"a"), (1, b"b"), (1, b"c")])
+        
+    def test_failed_write_not_remembered(self):
+        """Test that a key is written again after a failed write."""
+        self.deck.set_key_image.side_effect = [Exception("USB error"), None]
+        
+        self.hardware.set_key_images({0: b"a"})
+        self.hardware.set_key_images({0: b"a"})
+        
+        self.assertEqual(self.deck.set_key_image.call_count, 2)
+        
+    def test_writes_again_after_reconnect(self):
+        """Test that keys are rewritten after the device reconnects."""
+        self.hardware.set_key_images({0: b"a"})
+        
+        self.hardware._handle_device_disconnection()
+        self.assertEqual(self.hardware.key_images, {})
+        
+        new_deck = self._make_deck()
+        with patch('src.core.hardware.SDKDeviceManager') as mock_manager:
+            mock_manager.return_value.enumerate.return_value = [new_deck]
+            self.assertTrue(self.hardware._try_connect_device())
+            
+        self.hardware.set_key_images({0: b"a"})
+        new_deck.set_key_image.assert_called_once_with(0, b"a")
+
+        
+    def test_connect_resets_written_keys(self):
+        """Test that connecting (which resets the deck) forgets written keys."""
+        self.hardware.set_key_images({0: b"a"})
+        
+        with patch('src.core.hardware.SDKDeviceManager') as mock_manager:
+            mock_manager.return_value.enumerate.return_value = [self.deck]
+            self.hardware._try_connect_device()
+            
+        self.deck.reset.assert_called_once()
+        self.hardware.set_key_images({0: b"a"})
+        self.assertEqual(self.deck.set_key_image.call_count, 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
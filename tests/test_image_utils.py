@@ -0,0 +1,98 @@
+"""Tests for prepared image caching in image_utils."""
+
+import os
+import shutil
+import tempfile
+import unittest
+from collections import OrderedDict
+from unittest.mock import Mock, patch
+
+from PIL import Image
+
+from src.utils.image_utils import ImageCache, prepare_image_file_for_deck
+
+
+class TestPreparedImageCache(unittest.TestCase):
+    """Test cases for prepare_image_file_for_deck caching."""
+    
+    def setUp(self):
+        """Set up test environment with an empty cache and a fake deck."""
+        self.temp_dir = tempfile.mkdtemp()
+        
+        patcher = patch.object(ImageCache, '_prepared', OrderedDict())
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        
+        self.deck = Mock()
+        self.deck.deck_type.return_value = "Stream Deck Original"
+        self.deck.key_image_format.return_value = {'size': (72, 72)}
+        
+        # Count conversions instead of producing real device images
+        patcher = patch('src.utils.image_utils.prepare_image_for_deck',
+                        side_effect=lambda deck, image: image.tobytes())
+        self.mock_prepare = patcher.start()
+        self.addCleanup(patcher.stop)
+        
+    def tearDown(self):
+        """Clean up test environment."""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+        
+    def _save_image(self, filename: str, color: str) -> str:
+        """Save a small PNG and return its path."""
+        path = os.path.join(self.temp_dir, filename)
+        Image.new('RGB', (8, 8), color=color).save(path)
+        return path
+        
+    def test_unchanged_file_hits_cache(self):
+        """Test that an unchanged file is prepared only once."""
+        path = self._save_image("image.png", "red")
+        
+        first = prepare_image_file_for_deck(self.deck, path)
+        second = prepare_image_file_for_deck(self.deck, path)
+        
+        self.assertIs(first, second)
+        self.assertEqual(self.mock_prepare.call_count, 1)
+        
+    def test_rewritten_file_misses_cache(self):
+        """Test that rewriting the file in place prepares it again."""
+        path = self._save_image("image.png", "red")
+        first = prepare_image_file_for_deck(self.deck, path)
+        
+        self._save_image("image.png", "blue")
+        # Make sure mtime differs even on coarse-grained filesystems
+        st = os.stat(path)
+        os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+        second = prepare_image_file_for_deck(self.deck, path)
+        
+        self.assertNotEqual(first, second)
+        self.assertEqual(self.mock_prepare.call_count, 2)
+        
+    def test_replaced_file_misses_cache(self):
+        """Test that an atomic replace (write + rename) prepares it again."""
+        path = self._save_image("image.png", "red")
+        first = prepare_image_file_for_deck(self.deck, path)
+        
+        os.replace(self._save_image("image.tmp.png", "blue"), path)
+        second = prepare_image_file_for_deck(self.deck, path)
+        
+        self.assertNotEqual(first, second)
+        self.assertEqual(self.mock_prepare.call_count, 2)
+        
+    def test_least_recently_used_evicted(self):
+        """Test that the cache stays within its limit, dropping the oldest entry."""
+        with patch.object(ImageCache, '_prepared_limit', 2):
+            paths = [self._save_image(f"{i}.png", "red") for i in range(3)]
+            prepare_image_file_for_deck(self.deck, paths[0])
+            prepare_image_file_for_deck(self.deck, paths[1])
+            prepare_image_file_for_deck(self.deck, paths[0])  # 0 is now most recent
+            prepare_image_file_for_deck(self.deck, paths[2])  # evicts 1
+            
+            self.assertEqual(len(ImageCache._prepared), 2)
+            self.assertEqual([key[0] for key in ImageCache._prepared], [paths[0], paths[2]])
+            
+            prepare_image_file_for_deck(self.deck, paths[1])
+            self.assertEqual(self.mock_prepare.call_count, 4)
+
+
+if __name__ == '__main__':
+    unittest.main()
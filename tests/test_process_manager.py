@@ -9,6 +9,7 @@ import unittest
 from unittest.mock import Mock, patch, MagicMock
 
 from src.core.processes import ProcessManager
+from src.core.process_monitor import ProcessMonitor, get_process_monitor
 from src.utils.config import reset_config
 
 
@@ -254,6 +255,33 @@ class TestProcessManager(unittest.TestCase):
         # Verify it's no longer tracked
         self.assertNotIn("action", self.process_manager.processes)
         
+    def test_monitoring_uses_shared_monitor(self):
+        """Test that monitoring registers with the shared process monitor."""
+        monitor = get_process_monitor()
+        
+        self.process_manager.start_monitoring()
+        self.assertTrue(monitor.is_registered(self.process_manager))
+        
+        self.process_manager.stop_monitoring()
+        self.assertFalse(monitor.is_registered(self.process_manager))
+        
+    @patch('subprocess.Popen')
+    def test_check_processes_reports_completion(self, mock_popen):
+        """Test that a single check reports and forgets completed processes."""
+        mock_process = Mock()
+        mock_process.poll.return_value = 3
+        mock_popen.return_value = mock_process
+        
+        on_completion = Mock()
+        self.process_manager.on_script_completed = on_completion
+        
+        self._create_test_script("action.py", "exit(3)")
+        self.process_manager.start_script_async("action")
+        self.process_manager.check_processes()
+        
+        on_completion.assert_called_once_with("action", 3)
+        self.assertNotIn("action", self.process_manager.processes)
+        
     def test_cleanup(self):
         """Test cleanup stops all processes."""
         with patch.object(self.process_manager, 'stop_script') as mock_stop:
@@ -396,5 +424,88 @@ class TestProcessManager(unittest.TestCase):
         self.assertGreater(len(passed_env_vars), 2)  # Should have more than just our 2 vars
 
 
+class TestProcessMonitor(unittest.TestCase):
+    """Test cases for shared ProcessMonitor."""
+    
+    def setUp(self):
+        """Set up test environment."""
+        self.monitor = ProcessMonitor(poll_interval=0.05, use_pidfd=False)
+        
+    def test_single_thread_for_all_managers(self):
+        """Test that all registered managers are checked from one thread."""
+        managers = [Mock() for _ in range(3)]
+        for manager in managers:
+            self.monitor.register(manager)
+        thread = self.monitor.thread
+        
+        time.sleep(0.2)
+        
+        for manager in managers:
+            self.assertIs(self.monitor.thread, thread)
+            self.assertGreaterEqual(manager.check_processes.call_count, 1)
+            self.monitor.unregister(manager)
+            
+    def test_thread_exits_when_no_managers_left(self):
+        """Test that monitor thread stops once the last manager unregisters."""
+        manager = Mock()
+        self.monitor.register(manager)
+        thread = self.monitor.thread
+        
+        self.monitor.unregister(manager)
+        thread.join(timeout=1)
+        
+        self.assertFalse(thread.is_alive())
+        self.assertIsNone(self.monitor.thread)
+        
+    def test_manager_error_does_not_stop_monitoring(self):
+        """Test that an exception in one manager doesn't affect the others."""
+        failing = Mock(working_dir="/failing")
+        failing.check_processes.side_effect = Exception("Test error")
+        healthy = Mock()
+        
+        self.monitor.register(failing)
+        self.monitor.register(healthy)
+        time.sleep(0.2)
+        
+        self.assertGreaterEqual(healthy.check_processes.call_count, 2)
+        self.monitor.unregister(failing)
+        self.monitor.unregister(healthy)
+        
+    @unittest.skipUnless(hasattr(os, 'pidfd_open'), "pidfd_open not available")
+    def test_pidfd_reports_exit_without_polling(self):
+        """Test that managers are only checked when a watched process exits."""
+        monitor = ProcessMonitor(poll_interval=0.05, use_pidfd=True)
+        manager = Mock()
+        monitor.register(manager)
+        time.sleep(0.2)
+        
+        # Only the initial check after registration, no polling
+        self.assertEqual(manager.check_processes.call_count, 1)
+        
+        process = subprocess.Popen(['sleep', '0.1'])
+        monitor.watch(manager, process)
+        process.wait()
+        time.sleep(0.1)
+        
+        self.assertEqual(manager.check_processes.call_count, 2)
+        monitor.unregister(manager)
+        
+    @unittest.skipUnless(hasattr(os, 'pidfd_open'), "pidfd_open not available")
+    def test_pidfd_reaped_process_still_reported(self):
+        """Test that a process reaped before it could be watched is still checked."""
+        monitor = ProcessMonitor(poll_interval=0.05, use_pidfd=True)
+        manager = Mock()
+        monitor.register(manager)
+        time.sleep(0.1)
+        
+        process = subprocess.Popen(['true'])
+        process.wait()  # Reaped, pidfd_open fails with ProcessLookupError
+        monitor.watch(manager, process)
+        time.sleep(0.1)
+        
+        self.assertEqual(manager.check_processes.call_count, 2)
+        monitor.unregister(manager)
+
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,63 @@
+"""Tests for Scheduler class."""
+
+import threading
+import time
+import unittest
+from unittest.mock import Mock
+
+from src.core.scheduler import Scheduler
+
+
+class TestScheduler(unittest.TestCase):
+    """Test cases for Scheduler."""
+
+    def setUp(self):
+        """Set up test environment."""
+        self.scheduler = Scheduler()
+
+    def test_calls_run_in_deadline_order(self):
+        """Test that calls run by deadline, not by scheduling order."""
+        order = []
+        done = threading.Event()
+
+        self.scheduler.schedule(0.1, lambda: (order.append("late"), done.set()))
+        self.scheduler.schedule(0.05, order.append, "early")
+
+        self.assertTrue(done.wait(timeout=1))
+        self.assertEqual(order, ["early", "late"])
+
+    def test_single_thread_for_all_calls(self):
+        """Test that scheduling many calls doesn't start more threads."""
+        callback = Mock()
+        for _ in range(20):
+            self.scheduler.schedule(0.01, callback)
+        thread = self.scheduler.thread
+
+        time.sleep(0.1)
+
+        self.assertIs(self.scheduler.thread, thread)
+        self.assertEqual(callback.call_count, 20)
+
+    def test_cancelled_call_does_not_run(self):
+        """Test that a cancelled call is skipped."""
+        callback = Mock()
+        call = self.scheduler.schedule(0.05, callback)
+        call.cancel()
+
+        time.sleep(0.1)
+
+        callback.assert_not_called()
+
+    def test_callback_error_does_not_stop_scheduler(self):
+        """Test that an exception in one callback doesn't affect later calls."""
+        callback = Mock()
+        self.scheduler.schedule(0.01, Mock(side_effect=Exception("Test error")))
+        self.scheduler.schedule(0.02, callback)
+
+        time.sleep(0.1)
+
+        callback.assert_called_once()
+
+
+if __name__ == '__main__':
+    unittest.main()